@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 from pydantic_settings import BaseSettings
 
@@ -14,6 +15,86 @@ class Settings(BaseSettings):
     resend_api_key: str = ""
     resend_receiving_domain: str = ""  # e.g., "abc123.resend.app"
 
+    # Pooled HTTP connections for external services (per client)
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry_seconds: float = 30.0
+    http_timeout_seconds: float = 120.0
+
+    # Extraction pipeline
+    scrape_concurrency: int = 5  # Concurrent page scrapes per task
+    extract_concurrency: int = 4  # Concurrent page extractions per task
+    verify_concurrency: int = 8  # Concurrent claim verifications per task
+    # "grouped" checks all claims citing one source in a single LLM call,
+    # "per_claim" sends one fact-check per claim
+    verification_mode: Literal["grouped", "per_claim"] = "grouped"
+    max_claims_per_group: int = 15
+    # Claims of one type whose words overlap at least this much (Jaccard)
+    # are merged across pages and verified once
+    claim_dedup_threshold: float = 0.8
+    # Confirm near-verbatim claims by string/entity matching before the LLM
+    local_verification_enabled: bool = True
+    # Source passages (BM25-ranked per claim) sent to the fact-checker
+    verify_context_chars: int = 4000
+    # Drop search results whose title/description don't match the lead
+    relevance_filter_enabled: bool = True
+    relevance_min_score: float = 0.4
+    relevance_top_k: int = 8
+
+    # Persistent scrape/search caches (Mongo)
+    scrape_cache_enabled: bool = True
+    scrape_cache_max_age_seconds: int = 7 * 24 * 3600  # Freshness window
+    scrape_cache_ttl_seconds: int = 30 * 24 * 3600  # Hard expiry (TTL index)
+    search_cache_ttl_seconds: int = 24 * 3600
+
+    # LLM structured-output cache (in-process LRU backed by Mongo)
+    llm_cache_enabled: bool = True
+    llm_cache_max_entries: int = 2000
+    llm_cache_ttl_seconds: int = 30 * 24 * 3600
+
+    # Durable extraction job queue (Mongo)
+    job_visibility_timeout_seconds: int = 120  # Lease length without a heartbeat
+    job_heartbeat_seconds: int = 30
+    job_max_attempts: int = 3
+    job_retry_delay_seconds: int = 30
+    job_poll_interval_seconds: float = 1.0
+    job_log_limit: int = 500  # Log entries kept on each job document
+    job_ttl_seconds: int = 7 * 24 * 3600  # Finished jobs are deleted after this
+    # Run a worker inside the API process; disable when running worker.py
+    embedded_worker_enabled: bool = True
+    # Jobs run at once per worker. Jobs mostly wait on rate-limited APIs, so
+    # one embedded worker runs a full batch plus interactive jobs
+    worker_concurrency: int = 16
+    batch_max_concurrency: int = 8  # Jobs of one batch running across workers
+    # Worker slots kept free of bulk jobs, so interactive jobs start promptly
+    worker_interactive_slots: int = 2
+    # Campaign ID -> share of bulk worker slots relative to others (default 1)
+    campaign_weights: dict[str, float] = {}
+
+    # In-memory extraction task registry
+    task_ttl_seconds: int = 3600  # Finished tasks are forgotten after this
+    task_log_buffer_size: int = 200  # Log entries kept in memory per task
+    # Write entries pushed out of the buffer to Mongo so replays stay complete
+    task_log_spill_enabled: bool = False
+    task_log_spill_ttl_seconds: int = 7 * 24 * 3600
+    # Live events buffered per stream client; older progress lines are
+    # coalesced, then the oldest logs dropped, when a client falls behind
+    sse_subscriber_buffer_size: int = 100
+    sse_campaign_buffer_size: int = 1000  # Shared by every task of a campaign
+    # Progress lines within this window of the last one collapse to the
+    # latest; other log types are always sent (0 disables)
+    progress_coalesce_seconds: float = 0.25
+
+    # Process-wide rate limits; overrides are keyed "provider:model", e.g.
+    # {"openai:gpt-4o-mini": {"requests_per_minute": 300}}
+    openai_requests_per_minute: int = 500
+    openai_tokens_per_minute: int = 200_000
+    firecrawl_requests_per_minute: int = 100
+    rate_limit_overrides: dict[str, dict[str, int]] = {}
+    rate_limit_max_retries: int = 4
+    rate_limit_base_backoff_seconds: float = 1.0
+    rate_limit_max_backoff_seconds: float = 30.0
+
     class Config:
         env_file = ROOT_DIR / ".env"
         extra = "ignore"
@@ -39,8 +39,24 @@ class VerificationAnalysis(BaseModel):
     is_supported: bool
     reasoning: str
 
+class ClaimVerificationAnalysis(VerificationAnalysis):
+    claim_id: int = Field(..., description="Number of the claim being assessed")
+
+class GroupedVerificationAnalysis(BaseModel):
+    results: list[ClaimVerificationAnalysis] = Field(
+        default_factory=list,
+        description="One assessment per numbered claim"
+    )
+
 class ClaimVerified(Claim, VerificationAnalysis):
-    pass
+    verified_by: Literal["local", "llm"] | None = Field(
+        None,
+        description="Verifier tier that decided the claim (None if no check ran)"
+    )
+    alternate_urls: list[str] = Field(
+        default_factory=list,
+        description="Other sources of the same claim merged from other pages"
+    )
 
 class PersonClaims(BaseModel):
     person_name: str
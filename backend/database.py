@@ -1,4 +1,5 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo.errors import OperationFailure
 
 from config import settings
 
@@ -13,3 +14,18 @@ def get_database():
 def set_client(client: AsyncIOMotorClient | None):
     global db_client
     db_client = client
+
+
+async def ensure_ttl_index(
+    db: AsyncIOMotorDatabase, collection: str, field: str, ttl_seconds: int
+) -> None:
+    """Create a TTL index on field, updating its expiry if it already exists."""
+    try:
+        await db[collection].create_index(field, expireAfterSeconds=ttl_seconds)
+    except OperationFailure:
+        # Index exists with a different expiry
+        await db.command(
+            "collMod",
+            collection,
+            index={"keyPattern": {field: 1}, "expireAfterSeconds": ttl_seconds},
+        )
@@ -15,7 +15,25 @@ from motor.motor_asyncio import AsyncIOMotorClient
 
 from config import settings
 from database import get_database, set_client
-from routers import campaigns, extraction, identity, leads, proposal, proposals, webhooks
+from routers import (
+    campaigns,
+    extraction,
+    identity,
+    leads,
+    proposal,
+    proposals,
+    stats,
+    webhooks,
+)
+from services import (
+    extraction_task,
+    job_queue,
+    llm_cache,
+    scrape_cache,
+    search_cache,
+)
+from services.clients import Clients, set_clients
+from worker import Worker
 
 
 @asynccontextmanager
@@ -23,8 +41,23 @@ async def lifespan(app: FastAPI):
     # Startup
     client = AsyncIOMotorClient(settings.mongodb_uri)
     set_client(client)
+    clients = Clients()
+    set_clients(clients)
+    await scrape_cache.ensure_indexes(get_database())
+    await search_cache.ensure_indexes(get_database())
+    await llm_cache.ensure_indexes(get_database())
+    await job_queue.ensure_indexes(get_database())
+    await extraction_task.ensure_indexes(get_database())
+    worker = None
+    if settings.embedded_worker_enabled:
+        worker = Worker()
+        worker.start()
     yield
     # Shutdown
+    if worker:
+        await worker.stop()
+    await clients.close()
+    set_clients(None)
     client.close()
 
 
@@ -51,6 +84,7 @@ app.include_router(extraction.router)
 app.include_router(leads.router)
 app.include_router(proposals.router)
 app.include_router(webhooks.router)
+app.include_router(stats.router)
 
 
 @app.get("/api/health")
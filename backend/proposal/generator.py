@@ -1,15 +1,23 @@
+import json
 import logging
+from functools import partial
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
-from config import settings
 from crawling.schemas import ClaimVerified
 from schemas.proposal import ProposalAIOutput
+from services import llm_cache
+from services.rate_limit import estimate_tokens, limiter
 
 logger = logging.getLogger(__name__)
 
 SCORE_LABELS = {0: "none", 1: "low", 2: "medium", 3: "perfect"}
 
+MODEL = "gpt-4o-mini"
+
+# Bump when the prompt's meaning changes to invalidate cached responses
+PROMPT_VERSION = "1"
+
 
 def format_claims_for_matching(claims: list[ClaimVerified]) -> str:
     """Format verified claims for the matching prompt, including source URLs."""
@@ -20,15 +28,14 @@ def format_claims_for_matching(claims: list[ClaimVerified]) -> str:
     return "\n".join(lines) if lines else "(no verified claims)"
 
 
-def generate_proposal(
+async def generate_proposal(
+    openai_client: AsyncOpenAI,
     founder_name: str,
     founder_claims: list[ClaimVerified],
     lead_name: str,
     lead_claims: list[ClaimVerified],
 ) -> ProposalAIOutput:
     """Generate a scored proposal matching founder and lead claims."""
-    client = OpenAI(api_key=settings.openai_api_key)
-
     prompt = """You are an expert at finding meaningful connections for personalized outreach.
 
 Analyze the founder's and lead's verified claims to find connection points that could spark genuine conversations.
@@ -58,17 +65,34 @@ If no matches are found, set score to 0 and provide a brief reason explaining th
 LEAD ({lead_name}):
 {lead_claims_text}"""
 
-    try:
-        response = client.beta.chat.completions.parse(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": prompt},
-                {"role": "user", "content": user_content},
-            ],
-            response_format=ProposalAIOutput,
+    messages = [
+        {"role": "system", "content": prompt},
+        {"role": "user", "content": user_content},
+    ]
+
+    async def parse() -> ProposalAIOutput | None:
+        response = await limiter.call(
+            "openai",
+            MODEL,
+            partial(
+                openai_client.beta.chat.completions.parse,
+                model=MODEL,
+                messages=messages,
+                response_format=ProposalAIOutput,
+            ),
+            tokens=estimate_tokens(*(message["content"] for message in messages)),
         )
+        return response.choices[0].message.parsed
 
-        result = response.choices[0].message.parsed
+    try:
+        result = await llm_cache.cached_parse(
+            "generate_proposal",
+            MODEL,
+            PROMPT_VERSION,
+            ProposalAIOutput,
+            json.dumps(messages),
+            parse,
+        )
         if result:
             return result
     except Exception as e:
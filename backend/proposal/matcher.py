@@ -1,10 +1,19 @@
-from openai import OpenAI
+import json
+from functools import partial
+
+from openai import AsyncOpenAI
 
-from config import settings
 from crawling.schemas import Claim
+from services import llm_cache
+from services.rate_limit import estimate_tokens, limiter
 
 from .schemas import ProposalResult
 
+MODEL = "gpt-5-nano"
+
+# Bump when the prompt's meaning changes to invalidate cached responses
+PROMPT_VERSION = "1"
+
 
 def format_claims(claims: list[Claim]) -> str:
     lines = []
@@ -13,14 +22,13 @@ def format_claims(claims: list[Claim]) -> str:
     return "\n".join(lines) if lines else "(no claims)"
 
 
-def find_matches(
+async def find_matches(
+    openai_client: AsyncOpenAI,
     user_name: str,
     user_claims: list[Claim],
     target_person_name: str,
     target_claims: list[Claim],
 ) -> ProposalResult:
-    client = OpenAI(api_key=settings.openai_api_key)
-
     prompt = """You are an expert at finding meaningful connections between people.
 
 Analyze the claims of two people and find matches for personalized outreach.
@@ -39,16 +47,33 @@ Also suggest 2-3 icebreaker conversation starters based on the matches."""
 TARGET ({target_person_name}) CLAIMS:
 {format_claims(target_claims)}"""
 
-    response = client.beta.chat.completions.parse(
-        model="gpt-5-nano",
-        messages=[
-            {"role": "system", "content": prompt},
-            {"role": "user", "content": user_content},
-        ],
-        response_format=ProposalResult,
-    )
+    messages = [
+        {"role": "system", "content": prompt},
+        {"role": "user", "content": user_content},
+    ]
+
+    async def parse() -> ProposalResult | None:
+        response = await limiter.call(
+            "openai",
+            MODEL,
+            partial(
+                openai_client.beta.chat.completions.parse,
+                model=MODEL,
+                messages=messages,
+                response_format=ProposalResult,
+            ),
+            tokens=estimate_tokens(*(message["content"] for message in messages)),
+        )
+        return response.choices[0].message.parsed
 
-    result = response.choices[0].message.parsed
+    result = await llm_cache.cached_parse(
+        "find_matches",
+        MODEL,
+        PROMPT_VERSION,
+        ProposalResult,
+        json.dumps(messages),
+        parse,
+    )
     if result:
         result.target_person_name = target_person_name
     return result or ProposalResult(target_person_name=target_person_name)
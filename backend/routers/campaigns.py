@@ -1,5 +1,12 @@
-from fastapi import APIRouter, HTTPException
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
 
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import StreamingResponse
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from config import settings
 from database import get_database
 from schemas.campaign import (
     CampaignCreate,
@@ -8,6 +15,7 @@ from schemas.campaign import (
     CampaignListItem,
     CampaignProfileUpdate,
 )
+from services import job_queue
 from services.campaign import (
     create_campaign,
     get_campaign,
@@ -15,6 +23,13 @@ from services.campaign import (
     update_campaign_leads,
     update_campaign_profile,
 )
+from services.extraction_task import (
+    TaskStatus,
+    get_task,
+    subscribe_to_campaign,
+    unsubscribe_from_campaign,
+)
+from services.sse import KEEPALIVE_SECONDS, PING, SSE_HEADERS, format_event
 
 router = APIRouter(prefix="/api/campaigns", tags=["campaigns"])
 
@@ -51,10 +66,146 @@ async def update_campaign_profile_endpoint(
 
 
 @router.patch("/{campaign_id}/leads", status_code=204)
-async def update_campaign_leads_endpoint(
-    campaign_id: str, data: CampaignLeadsUpdate
-):
+async def update_campaign_leads_endpoint(campaign_id: str, data: CampaignLeadsUpdate):
     db = get_database()
     success = await update_campaign_leads(db, campaign_id, data.leads)
     if not success:
         raise HTTPException(status_code=404, detail="Campaign not found")
+
+
+@router.get("/{campaign_id}/events")
+async def stream_campaign_events(
+    campaign_id: str,
+    since: str | None = None,
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
+):
+    """
+    Stream events from every extraction task of a campaign over one
+    connection. Events carry task_id and lead_id; their IDs are timestamps,
+    so a reconnecting client (Last-Event-ID, or ?since=) resumes after them.
+    """
+    db = get_database()
+    if not await get_campaign(db, campaign_id):
+        raise HTTPException(status_code=404, detail="Campaign not found")
+    return StreamingResponse(
+        _campaign_events(db, campaign_id, _parse_timestamp(since or last_event_id)),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def _frame(event_type: str, data: dict) -> bytes:
+    return format_event(event_type, data, data.get("timestamp"))
+
+
+async def _campaign_events(
+    db: AsyncIOMotorDatabase, campaign_id: str, since: datetime | None
+):
+    """
+    Tasks run by this process are pushed to us; jobs running elsewhere are
+    polled from the job queue. One keepalive covers the whole campaign.
+    """
+    subscriber = await subscribe_to_campaign(campaign_id, since)
+    remote = _RemoteJobs(db, campaign_id, since)
+    next_poll = time.monotonic()
+    last_event = time.monotonic()
+    try:
+        while True:
+            timeout = max(0.0, next_poll - time.monotonic())
+            try:
+                event = await asyncio.wait_for(subscriber.get(), timeout)
+            except TimeoutError:
+                pass
+            else:
+                yield event.frame
+                last_event = time.monotonic()
+                continue
+
+            for frame in await remote.poll():
+                yield frame
+                last_event = time.monotonic()
+            next_poll = time.monotonic() + settings.job_poll_interval_seconds
+
+            if time.monotonic() - last_event >= KEEPALIVE_SECONDS:
+                yield PING
+                last_event = time.monotonic()
+    finally:
+        unsubscribe_from_campaign(campaign_id, subscriber)
+
+
+class _RemoteJobs:
+    """Follows a campaign's jobs that run in other processes."""
+
+    def __init__(
+        self, db: AsyncIOMotorDatabase, campaign_id: str, since: datetime | None
+    ):
+        self._db = db
+        self._campaign_id = campaign_id
+        self._since = since
+        self._finished_after = since or datetime.now(UTC) - timedelta(
+            seconds=settings.task_ttl_seconds
+        )
+        # Job ID -> (attempt, ID of the last log entry read)
+        self._sent: dict[str, tuple[int, int]] = {}
+        self._done: set[str] = set()
+
+    async def poll(self) -> list[bytes]:
+        """Encoded frames for remote jobs' new logs and terminal events."""
+        events = []
+        jobs = await job_queue.campaign_jobs(
+            self._db,
+            self._campaign_id,
+            self._finished_after,
+            self._sent,
+            exclude=self._done,
+        )
+        for job in jobs:
+            job_id = job["_id"]
+            first_seen = job_id not in self._sent
+            # Read up to here either way; local tasks are pushed to us
+            self._sent[job_id] = (job["attempts"], job["log_count"])
+            if get_task(job_id):
+                if job["status"] != TaskStatus.RUNNING.value:
+                    self._done.add(job_id)
+                continue
+            tags = {"task_id": job_id, "lead_id": job["payload"].get("lead_id")}
+
+            for entry in job["logs"]:
+                timestamp = _parse_timestamp(entry.get("timestamp"))
+                if (
+                    first_seen
+                    and self._since
+                    and timestamp
+                    and timestamp <= self._since
+                ):
+                    continue
+                events.append(_frame("log", {**entry, **tags}))
+
+            if job["status"] == TaskStatus.COMPLETED.value:
+                event_type = "complete"
+                data = {"extraction_id": job.get("extraction_id")}
+            elif job["status"] == TaskStatus.FAILED.value:
+                event_type = "error"
+                data = {"message": job.get("error")}
+            else:
+                continue
+            self._done.add(job_id)
+            finished_at = job["finished_at"]
+            if finished_at.tzinfo is None:
+                finished_at = finished_at.replace(tzinfo=UTC)
+            events.append(
+                _frame(
+                    event_type, {**data, **tags, "timestamp": finished_at.isoformat()}
+                )
+            )
+        return events
@@ -1,28 +1,61 @@
 import asyncio
-import json
 import logging
+import time
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException
 from fastapi.responses import StreamingResponse
 
+from config import settings
+from database import get_database
+from services import job_queue
 from services.extraction_task import (
     TaskStatus,
     get_task,
     subscribe_to_task,
     unsubscribe_from_task,
 )
+from services.sse import KEEPALIVE_SECONDS, PING, SSE_HEADERS, format_event
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/extraction", tags=["extraction"])
 
 
+def _sse(event_type: str, data: dict) -> bytes:
+    """Log entries carry their ID so clients can resume after them."""
+    return format_event(
+        event_type, data, data.get("id") if event_type == "log" else None
+    )
+
+
+def _resume_point(header: str | None, query: int | None) -> int:
+    """ID of the last log entry the client saw; 0 streams from the start."""
+    if query is not None:
+        return max(0, query)
+    try:
+        return max(0, int(header or 0))
+    except ValueError:
+        return 0
+
+
 @router.get("/{task_id}/status")
 async def get_extraction_status(task_id: str):
     """Get the current status of an extraction task."""
     task = get_task(task_id)
     if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
+        # Queued, or running in another process
+        job = await job_queue.get_job(get_database(), task_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Task not found")
+        return {
+            "id": job["_id"],
+            "campaign_id": job["payload"]["campaign_id"],
+            "query": job["payload"]["query"],
+            "status": job["status"],
+            "extraction_id": job.get("extraction_id"),
+            "error": job.get("error"),
+            "log_count": job["log_count"],
+        }
 
     return {
         "id": task.id,
@@ -31,29 +64,50 @@ async def get_extraction_status(task_id: str):
         "status": task.status.value,
         "extraction_id": task.extraction_id,
         "error": task.error,
-        "log_count": len(task.logs),
+        "log_count": task.log_count,
     }
 
 
 @router.get("/{task_id}/stream")
-async def stream_extraction_logs(task_id: str):
-    """Stream extraction logs via Server-Sent Events."""
+async def stream_extraction_logs(
+    task_id: str,
+    last_event_id: int | None = None,
+    last_event_id_header: str | None = Header(None, alias="Last-Event-ID"),
+):
+    """
+    Stream extraction logs via Server-Sent Events. Reconnecting clients
+    send Last-Event-ID (or ?last_event_id=) and only get what they missed.
+    """
+    after = _resume_point(last_event_id_header, last_event_id)
     task = get_task(task_id)
     if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
+        if not await job_queue.get_job(get_database(), task_id):
+            raise HTTPException(status_code=404, detail="Task not found")
+        return StreamingResponse(
+            _follow_job(task_id, after),
+            media_type="text/event-stream",
+            headers=SSE_HEADERS,
+        )
 
     async def event_generator():
-        queue = await subscribe_to_task(task_id)
+        queue = await subscribe_to_task(task_id, after)
         try:
             while True:
                 try:
-                    event_type, data = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    yield f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=KEEPALIVE_SECONDS
+                    )
+                    if event is None:
+                        # The job went back to the queue (retry or lost lease)
+                        async for frame in _follow_job(task_id, task.log_count):
+                            yield frame
+                        break
+                    yield event.frame
 
-                    if event_type in ("complete", "error"):
+                    if event.terminal:
                         break
                 except TimeoutError:
-                    yield "event: ping\ndata: {}\n\n"
+                    yield PING
 
                 # Check if task is done
                 current_task = get_task(task_id)
@@ -65,11 +119,47 @@ async def stream_extraction_logs(task_id: str):
             unsubscribe_from_task(task_id, queue)
 
     return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
+        event_generator(), media_type="text/event-stream", headers=SSE_HEADERS
     )
+
+
+async def _follow_job(task_id: str, after: int = 0):
+    """
+    Stream a job this process isn't running by polling its job document.
+    Logs restart when the job is retried, since each attempt logs afresh.
+    """
+    db = get_database()
+    run = None
+    sent = after
+    last_event = time.monotonic()
+    while True:
+        job = await job_queue.get_job(db, task_id)
+        if not job:
+            yield _sse("error", {"message": "Task not found"})
+            return
+
+        # Each claim starts a run with fresh logs; a run released at shutdown
+        # keeps its attempt count, so the claim time tells runs apart
+        current = (job["attempts"], job.get("started_at"))
+        if current != run or job["log_count"] < sent:
+            # A resume point only applies to the run the client was following
+            sent = sent if run is None and sent <= job["log_count"] else 0
+            run = current
+        new = min(job["log_count"] - sent, len(job["logs"]))
+        if new > 0:
+            for entry in job["logs"][-new:]:
+                yield _sse("log", entry)
+            sent = job["log_count"]
+            last_event = time.monotonic()
+
+        if job["status"] == TaskStatus.COMPLETED.value:
+            yield _sse("complete", {"extraction_id": job.get("extraction_id")})
+            return
+        if job["status"] == TaskStatus.FAILED.value:
+            yield _sse("error", {"message": job.get("error")})
+            return
+
+        if time.monotonic() - last_event >= KEEPALIVE_SECONDS:
+            yield PING
+            last_event = time.monotonic()
+        await asyncio.sleep(settings.job_poll_interval_seconds)
@@ -1,18 +1,21 @@
 import logging
 
-from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, File, Form, HTTPException, UploadFile
 
 from database import get_database
 from schemas.profile import ProfileExtractionResponse
+from search_extract.events import EventChannel
 from search_extract.pipeline_async import run_extraction_pipeline
 from services import campaign as campaign_service
+from services import job_queue
+from services.clients import get_clients
 from services.extraction_task import (
     LogType,
     add_log,
     complete_task,
-    create_log_callback,
-    create_task,
     fail_task,
+    log_events,
+    new_task_id,
     set_task_running,
 )
 from services.reducto import extract_profile_from_pdf
@@ -27,17 +30,18 @@ MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 async def run_extraction_background(task_id: str, campaign_id: str, query: str):
     """Background task to run the extraction pipeline."""
     db = get_database()
-    log = create_log_callback(task_id)
     set_task_running(task_id)
 
     try:
-        verified_id = await run_extraction_pipeline(
-            db=db,
-            query=query,
-            campaign_id=campaign_id,
-            log=log,
-            limit=5,
-        )
+        async with EventChannel(log_events(task_id)) as events:
+            verified_id = await run_extraction_pipeline(
+                db=db,
+                clients=get_clients(),
+                query=query,
+                campaign_id=campaign_id,
+                events=events,
+                limit=5,
+            )
 
         # Update campaign with extraction ID
         await campaign_service.update_campaign_extraction_id(
@@ -53,7 +57,6 @@ async def run_extraction_background(task_id: str, campaign_id: str, query: str):
 
 @router.post("/extract", response_model=ProfileExtractionResponse)
 async def extract_profile(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     campaign_id: str = Form(...),
 ):
@@ -84,7 +87,9 @@ async def extract_profile(
 
     try:
         logger.info(f"Extracting profile from {file.filename}")
-        profile = await extract_profile_from_pdf(content)
+        profile = await extract_profile_from_pdf(
+            get_clients().reducto, content
+        )
         logger.info(f"Successfully extracted profile: {profile.name}")
 
         # Save profile to campaign immediately
@@ -98,14 +103,17 @@ async def extract_profile(
             query_parts.append(profile.current_job_title)
         query = " ".join(query_parts) if query_parts else None
 
-        # Create extraction task and start background processing (only if we have a query)
+        # Queue the whoami extraction (only if we have a query)
         extraction_task_id = None
         if query:
-            task = create_task(campaign_id, query)
-            background_tasks.add_task(
-                run_extraction_background, task.id, campaign_id, query
+            extraction_task_id = new_task_id()
+            await job_queue.enqueue(
+                db,
+                extraction_task_id,
+                "identity",
+                {"campaign_id": campaign_id, "query": query},
+                lane=job_queue.INTERACTIVE,
             )
-            extraction_task_id = task.id
 
         return ProfileExtractionResponse(
             profile=profile,
@@ -1,9 +1,11 @@
+import json
 import logging
 from datetime import UTC, datetime
+from functools import partial
 
 from bson import ObjectId
-from fastapi import APIRouter, BackgroundTasks, HTTPException
-from openai import OpenAI
+from fastapi import APIRouter, HTTPException
+from openai import AsyncOpenAI
 
 from config import settings
 from crawling.schemas import ClaimVerified
@@ -12,31 +14,44 @@ from proposal.generator import SCORE_LABELS, generate_proposal
 from schemas.leads import (
     ExtractLeadRequest,
     ExtractLeadResponse,
+    ExtractLeadsBatchRequest,
+    ExtractLeadsBatchResponse,
     LeadStatus,
+    LeadTask,
     ParsedQueries,
     ParseLeadsRequest,
     ParseLeadsResponse,
 )
+from search_extract.events import EventChannel
 from search_extract.pipeline_async import run_extraction_pipeline
 from services import campaign as campaign_service
+from services import job_queue, llm_cache
+from services.clients import get_clients
 from services.extraction_task import (
     LogType,
     add_log,
     complete_task,
-    create_task_for_lead,
     fail_task,
+    log_events,
+    new_task_id,
     set_task_running,
 )
+from services.rate_limit import estimate_tokens, limiter
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/leads", tags=["leads"])
 
+PARSE_MODEL = "gpt-5-nano"
+
+# Bump when the parsing prompt's meaning changes to invalidate cached responses
+PARSE_PROMPT_VERSION = "1"
 
-def parse_leads_with_openai(raw_text: str) -> list[str]:
-    """Use OpenAI to parse raw lead text into clean search queries."""
-    client = OpenAI(api_key=settings.openai_api_key)
 
+async def parse_leads_with_openai(
+    openai_client: AsyncOpenAI, raw_text: str
+) -> list[str]:
+    """Use OpenAI to parse raw lead text into clean search queries."""
     prompt = """You are an expert at parsing lead lists.
 Extract individual leads from the input text.
 
@@ -61,16 +76,33 @@ Output: ["John Smith CEO Acme Corp"]
 Input: "1. Jane Doe (Product Manager at TechCo)"
 Output: ["Jane Doe Product Manager TechCo"]"""
 
-    response = client.beta.chat.completions.parse(
-        model="gpt-5-nano",
-        messages=[
-            {"role": "system", "content": prompt},
-            {"role": "user", "content": raw_text},
-        ],
-        response_format=ParsedQueries,
+    messages = [
+        {"role": "system", "content": prompt},
+        {"role": "user", "content": raw_text},
+    ]
+
+    async def parse() -> ParsedQueries | None:
+        response = await limiter.call(
+            "openai",
+            PARSE_MODEL,
+            partial(
+                openai_client.beta.chat.completions.parse,
+                model=PARSE_MODEL,
+                messages=messages,
+                response_format=ParsedQueries,
+            ),
+            tokens=estimate_tokens(*(message["content"] for message in messages)),
+        )
+        return response.choices[0].message.parsed
+
+    result = await llm_cache.cached_parse(
+        "parse_leads",
+        PARSE_MODEL,
+        PARSE_PROMPT_VERSION,
+        ParsedQueries,
+        json.dumps(messages),
+        parse,
     )
-
-    result = response.choices[0].message.parsed
     return result.queries if result else []
 
 
@@ -82,7 +114,9 @@ async def parse_leads(request: ParseLeadsRequest) -> ParseLeadsResponse:
 
     try:
         logger.info(f"Parsing leads from {len(request.raw_text)} characters of text")
-        queries = parse_leads_with_openai(request.raw_text)
+        queries = await parse_leads_with_openai(
+            get_clients().openai, request.raw_text
+        )
         logger.info(f"Parsed {len(queries)} lead queries")
         return ParseLeadsResponse(queries=queries)
     except Exception as e:
@@ -155,7 +189,9 @@ async def _generate_proposal_for_lead(
     await add_log(task_id, f"{prefix} Generating proposal...", LogType.INFO)
 
     # Generate proposal
-    result = generate_proposal(founder_name, founder_claims, lead_name, lead_claims)
+    result = await generate_proposal(
+        get_clients().openai, founder_name, founder_claims, lead_name, lead_claims
+    )
 
     # Save to database
     proposal_doc = {
@@ -185,26 +221,20 @@ async def run_lead_extraction_background(
     lead_index: int,
 ):
     """Background task to run lead extraction pipeline with prefixed logging."""
-    import asyncio
-
     db = get_database()
     prefix = f"[Lead {str(lead_index + 1).zfill(2)}]"
-
-    def prefixed_log(
-        message: str, log_type: LogType = LogType.INFO, progress: int | None = None
-    ):
-        asyncio.create_task(add_log(task_id, f"{prefix} {message}", log_type, progress))
-
     set_task_running(task_id)
 
     try:
-        verified_id = await run_extraction_pipeline(
-            db=db,
-            query=query,
-            campaign_id=campaign_id,
-            log=prefixed_log,
-            limit=5,
-        )
+        async with EventChannel(log_events(task_id, f"{prefix} ")) as events:
+            verified_id = await run_extraction_pipeline(
+                db=db,
+                clients=get_clients(),
+                query=query,
+                campaign_id=campaign_id,
+                events=events,
+                limit=5,
+            )
 
         # Update lead status in campaign
         await campaign_service.update_lead_status(
@@ -244,10 +274,7 @@ async def run_lead_extraction_background(
 
 
 @router.post("/extract", response_model=ExtractLeadResponse)
-async def extract_lead(
-    background_tasks: BackgroundTasks,
-    request: ExtractLeadRequest,
-):
+async def extract_lead(request: ExtractLeadRequest):
     """Start extraction for a single lead."""
     db = get_database()
 
@@ -256,13 +283,7 @@ async def extract_lead(
     if not campaign:
         raise HTTPException(status_code=404, detail="Campaign not found")
 
-    # Create task for this lead
-    task = create_task_for_lead(
-        campaign_id=request.campaign_id,
-        query=request.query,
-        lead_id=request.lead_id,
-        lead_index=request.lead_index,
-    )
+    task_id = new_task_id()
 
     # Update lead status to processing
     await campaign_service.update_lead_status(
@@ -270,17 +291,88 @@ async def extract_lead(
         request.campaign_id,
         request.lead_id,
         status=LeadStatus.PROCESSING,
-        extraction_task_id=task.id,
+        extraction_task_id=task_id,
     )
 
-    # Start background extraction
-    background_tasks.add_task(
-        run_lead_extraction_background,
-        task.id,
-        request.campaign_id,
-        request.lead_id,
-        request.query,
-        request.lead_index,
+    # Queue the extraction; a worker runs run_lead_extraction_background
+    await job_queue.enqueue(
+        db,
+        task_id,
+        "lead",
+        {
+            "campaign_id": request.campaign_id,
+            "lead_id": request.lead_id,
+            "query": request.query,
+            "lead_index": request.lead_index,
+        },
+        lane=job_queue.INTERACTIVE,
     )
 
-    return ExtractLeadResponse(extraction_task_id=task.id)
+    return ExtractLeadResponse(extraction_task_id=task_id)
+
+
+@router.post("/extract-batch", response_model=ExtractLeadsBatchResponse)
+async def extract_leads_batch(request: ExtractLeadsBatchRequest):
+    """
+    Start extraction for many leads of a campaign (every pending lead if
+    lead_ids is omitted). Leads are marked processing in one atomic update
+    and queued as one batch, of which at most batch_max_concurrency run at
+    once. Leads already processing are reported as skipped.
+    """
+    db = get_database()
+
+    leads = await campaign_service.get_campaign_leads(db, request.campaign_id)
+    if leads is None:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+
+    if request.lead_ids is None:
+        selected = [
+            (index, lead)
+            for index, lead in enumerate(leads)
+            if lead.status == LeadStatus.PENDING
+        ]
+    else:
+        wanted = set(request.lead_ids)
+        selected = [
+            (index, lead)
+            for index, lead in enumerate(leads)
+            if lead.id in wanted and lead.status != LeadStatus.PROCESSING
+        ]
+    batch_id = new_task_id()
+    task_ids = {lead.id: new_task_id() for _, lead in selected}
+    # Another batch may have claimed some of these leads since they were read
+    marked = await campaign_service.mark_leads_processing(
+        db, request.campaign_id, task_ids
+    )
+    selected = [(index, lead) for index, lead in selected if lead.id in marked]
+    requested = task_ids if request.lead_ids is None else request.lead_ids
+    skipped = [lead_id for lead_id in requested if lead_id not in marked]
+
+    await job_queue.enqueue_many(
+        db,
+        [
+            (
+                task_ids[lead.id],
+                "lead",
+                {
+                    "campaign_id": request.campaign_id,
+                    "lead_id": lead.id,
+                    "query": lead.query,
+                    "lead_index": index,
+                },
+            )
+            for index, lead in selected
+        ],
+        group=f"batch-{batch_id}",
+        max_running=settings.batch_max_concurrency,
+    )
+
+    logger.info(f"Queued {len(selected)} leads of campaign {request.campaign_id}")
+    return ExtractLeadsBatchResponse(
+        batch_id=batch_id,
+        tasks=[
+            LeadTask(lead_id=lead.id, extraction_task_id=task_ids[lead.id])
+            for _, lead in selected
+        ],
+        skipped=skipped,
+    )
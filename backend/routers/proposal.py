@@ -11,6 +11,7 @@ from proposal.schemas import (
     ProposalResult,
     UserProfileResponse,
 )
+from services.clients import get_clients
 
 router = APIRouter(prefix="/api/proposal", tags=["proposal"])
 
@@ -96,7 +97,8 @@ async def match_claims(request: MatchRequest):
     user_claims = [Claim(**c) for c in user_doc.get("claims", [])]
     target_claims_parsed = [Claim(**c) for c in target_claims]
 
-    result = find_matches(
+    result = await find_matches(
+        get_clients().openai,
         user_name=user_doc["name"],
         user_claims=user_claims,
         target_person_name=target_name,
@@ -12,6 +12,7 @@ from schemas.proposal import (
     Proposal,
     ProposalListResponse,
 )
+from services.clients import get_clients
 
 logger = logging.getLogger(__name__)
 
@@ -95,7 +96,9 @@ async def generate_proposal_endpoint(request: GenerateProposalRequest):
         lead_claims.extend([ClaimVerified(**c) for c in person.get("claims", [])])
 
     # Generate proposal
-    result = generate_proposal(founder_name, founder_claims, lead_name, lead_claims)
+    result = await generate_proposal(
+        get_clients().openai, founder_name, founder_claims, lead_name, lead_claims
+    )
 
     # Save to database
     proposal_doc = {
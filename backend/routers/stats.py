@@ -0,0 +1,26 @@
+from fastapi import APIRouter
+
+from database import get_database
+from services import (
+    extraction_task,
+    job_queue,
+    llm_cache,
+    scrape_cache,
+    search_cache,
+)
+from services.rate_limit import limiter
+
+router = APIRouter(prefix="/api/stats", tags=["stats"])
+
+
+@router.get("")
+async def get_stats():
+    """Runtime counters for caches and external-call infrastructure."""
+    return {
+        "scrape_cache": scrape_cache.stats.to_dict(),
+        "search_cache": search_cache.stats.to_dict(),
+        "llm_cache": llm_cache.get_stats(),
+        "rate_limits": limiter.get_stats(),
+        "jobs": await job_queue.get_stats(get_database()),
+        "tasks": extraction_task.get_stats(),
+    }
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Request
 from database import get_database
 from routers.leads import parse_leads_with_openai
 from services.campaign import append_leads_to_campaign
+from services.clients import get_clients
 from services.email import extract_campaign_id, get_received_email_content
 
 logger = logging.getLogger(__name__)
@@ -39,13 +40,13 @@ async def handle_resend_webhook(request: Request):
         return {"status": "error", "reason": "invalid email address format"}
 
     # Fetch email content from Resend Receiving API
-    email_content = await get_received_email_content(email_id)
+    email_content = await get_received_email_content(get_clients().http, email_id)
     if not email_content:
         logger.error(f"Failed to fetch email content for: {email_id}")
         return {"status": "error", "reason": "failed to fetch email content"}
 
     try:
-        leads = parse_leads_with_openai(email_content)
+        leads = await parse_leads_with_openai(get_clients().openai, email_content)
         logger.info(f"Parsed {len(leads)} leads from email for campaign {campaign_id}")
     except Exception as e:
         logger.exception(f"Failed to parse leads: {e}")
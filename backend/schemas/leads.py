@@ -42,3 +42,21 @@ class ExtractLeadRequest(BaseModel):
 
 class ExtractLeadResponse(BaseModel):
     extraction_task_id: str
+
+
+class ExtractLeadsBatchRequest(BaseModel):
+    campaign_id: str
+    # None starts every pending lead of the campaign
+    lead_ids: list[str] | None = None
+
+
+class LeadTask(BaseModel):
+    lead_id: str
+    extraction_task_id: str
+
+
+class ExtractLeadsBatchResponse(BaseModel):
+    batch_id: str
+    tasks: list[LeadTask]
+    # Requested leads that were not started (unknown or already processing)
+    skipped: list[str]
@@ -0,0 +1,71 @@
+from dataclasses import dataclass, field
+
+from config import settings
+from crawling.schemas import Claim
+from search_extract.relevance import STOPWORDS, domain_prior, tokenize
+from search_extract.urls import canonicalize_url
+
+
+def _stem(token: str) -> str:
+    for suffix in ("ing", "ed", "es", "s"):
+        if token.endswith(suffix) and len(token) > len(suffix) + 2:
+            return token[: -len(suffix)]
+    return token
+
+
+def claim_terms(claim: Claim) -> frozenset[str]:
+    """Normalized content words of a claim, lightly stemmed."""
+    return frozenset(
+        _stem(token) for token in tokenize(claim.one_liner) if token not in STOPWORDS
+    )
+
+
+@dataclass
+class ClaimCluster:
+    """Near-duplicate claims of one type; the first claim is verified."""
+
+    claim_type: str
+    terms: frozenset[str]
+    urls: list[str] = field(default_factory=list)
+    _seen: set[str] = field(default_factory=set)
+
+    def add_url(self, url: str) -> None:
+        key = canonicalize_url(url)
+        if key not in self._seen:
+            self._seen.add(key)
+            self.urls.append(url)
+
+    def alternates(self, url: str) -> list[str]:
+        """Other sources for the claim, most trusted domains first."""
+        key = canonicalize_url(url)
+        others = [other for other in self.urls if canonicalize_url(other) != key]
+        return sorted(others, key=lambda other: (-domain_prior(other), other))
+
+
+class ClaimClusters:
+    """
+    Groups claims from every page of a run by type and word overlap
+    (Jaccard similarity of their content words).
+    """
+
+    def __init__(self, threshold: float | None = None):
+        self._threshold = threshold or settings.claim_dedup_threshold
+        self._clusters: list[ClaimCluster] = []
+        self.duplicates = 0
+
+    def add(self, claim: Claim) -> tuple[ClaimCluster, bool]:
+        """Place a claim in a cluster. Returns the cluster and whether it is new."""
+        terms = claim_terms(claim)
+        for cluster in self._clusters:
+            if cluster.claim_type != claim.type:
+                continue
+            union = terms | cluster.terms
+            if union and len(terms & cluster.terms) / len(union) >= self._threshold:
+                cluster.add_url(claim.url)
+                self.duplicates += 1
+                return cluster, False
+
+        cluster = ClaimCluster(claim_type=claim.type, terms=terms)
+        cluster.add_url(claim.url)
+        self._clusters.append(cluster)
+        return cluster, True
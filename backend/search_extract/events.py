@@ -0,0 +1,135 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Literal
+
+from crawling.schemas import Claim, ClaimVerified
+from services.extraction_task import LogType
+
+logger = logging.getLogger(__name__)
+
+Stage = Literal["scrape", "extract"]
+
+STAGE_LABELS = {
+    "scrape": "Scraped page",
+    "extract": "Extracted page",
+}
+
+
+@dataclass(frozen=True)
+class LogLine:
+    """A free-form status line."""
+
+    text: str
+    log_type: LogType = LogType.INFO
+    progress: int | None = None
+
+    @property
+    def message(self) -> str:
+        return self.text
+
+
+@dataclass(frozen=True)
+class StageProgress:
+    """One unit of work finished in a stage; progress is overall (0-100)."""
+
+    stage: Stage
+    done: int
+    total: int
+    progress: int
+    detail: str
+    log_type: LogType = LogType.PROGRESS
+
+    @property
+    def message(self) -> str:
+        return f"{STAGE_LABELS[self.stage]} {self.done}/{self.total}: {self.detail}"
+
+
+@dataclass(frozen=True)
+class PageExtracted:
+    url: str
+    claims: int
+    merged: int
+    chars_before: int
+    chars_after: int
+    log_type: LogType = LogType.INFO
+    progress: int | None = None
+
+    @property
+    def message(self) -> None:
+        # Reported through the extract stage's StageProgress line
+        return None
+
+
+@dataclass(frozen=True)
+class ClaimChecked:
+    """A claim's verdict; progress is overall (0-100), as on StageProgress."""
+
+    claim: Claim
+    result: ClaimVerified
+    progress: int | None = None
+
+    @property
+    def log_type(self) -> LogType:
+        return LogType.SUCCESS if self.result.is_supported else LogType.ERROR
+
+    @property
+    def message(self) -> str:
+        status = "✓" if self.result.is_supported else "✗"
+        return f"{status} {self.result.reasoning[:60]}"
+
+
+PipelineEvent = LogLine | StageProgress | PageExtracted | ClaimChecked
+
+Emit = Callable[[PipelineEvent], None]
+Consumer = Callable[[PipelineEvent], Awaitable[None]]
+
+_CLOSE = object()
+
+
+class EventChannel:
+    """
+    Ordered channel for one pipeline run. emit() never blocks; a single
+    drain task hands each event, in emit order, to every attached consumer
+    (the task registry, metrics, ...). Use as an async context manager so
+    every event is delivered before the block exits.
+    """
+
+    def __init__(self, *consumers: Consumer):
+        self._consumers = list(consumers)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._drain: asyncio.Task | None = None
+
+    def attach(self, consumer: Consumer) -> None:
+        self._consumers.append(consumer)
+
+    def emit(self, event: PipelineEvent) -> None:
+        self._queue.put_nowait(event)
+
+    async def __aenter__(self) -> "EventChannel":
+        self._drain = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        if self._drain is None:
+            return
+        if exc_type is asyncio.CancelledError:
+            self._drain.cancel()
+            return
+        self._queue.put_nowait(_CLOSE)
+        await self._drain
+
+    async def _run(self) -> None:
+        while (event := await self._queue.get()) is not _CLOSE:
+            for consumer in self._consumers:
+                try:
+                    await consumer(event)
+                except Exception:
+                    logger.exception(f"Pipeline event consumer failed on {event!r}")
+
+
+def print_event(event: PipelineEvent) -> None:
+    """Default emitter when a run has no channel (scripts, notebooks)."""
+    if event.message is not None:
+        print(f"[{event.log_type.value}] {event.message}")
@@ -0,0 +1,96 @@
+import re
+from functools import lru_cache
+
+from crawling.schemas import Claim
+from search_extract.relevance import STOPWORDS, tokenize
+from search_extract.retrieval import passage_index
+
+# Claim types that are usually plain facts (who, where, which organisation)
+ENTITY_CLAIM_TYPES = {"prior_employer", "education", "location", "language"}
+
+# Capitalized word runs: names, companies, schools, places
+ENTITY = re.compile(
+    r"[A-Z0-9][\w&'.-]*(?:\s+(?:of|de|the|and|&)?\s*[A-Z0-9][\w&'.-]*)*"
+)
+
+PRONOUNS = {"he", "she", "they", "his", "her", "their"}
+NEGATIONS = {"not", "never", "nor", "no", "didn", "doesn", "isn", "wasn"}
+
+# Share of the claim's content words that must appear in the window
+MIN_TERM_COVERAGE = 0.8
+
+# Content words a claim needs before a verbatim match confirms it; a bare
+# "Google" or "Worked at Google" says too little to trust a substring match
+MIN_VERBATIM_TERMS = 3
+
+# Consecutive sentences matched together, so "Jane Doe ... She lives in
+# Berlin" still links the name to the place
+WINDOW_SENTENCES = 2
+
+
+def _normalize(text: str) -> str:
+    return f" {' '.join(tokenize(text))} "
+
+
+@lru_cache(maxsize=64)
+def _sentence_windows(content: str) -> tuple[str, ...]:
+    """Normalized windows of consecutive sentences within each passage."""
+    windows = []
+    for passage in passage_index(content).passages:
+        sentences = [
+            _normalize(sentence)
+            for sentence in re.split(r"(?<=[.!?])\s+|\n+", passage)
+            if sentence.strip()
+        ]
+        for start in range(max(1, len(sentences) - WINDOW_SENTENCES + 1)):
+            windows.append(" ".join(sentences[start : start + WINDOW_SENTENCES]))
+    return tuple(windows)
+
+
+def _entities(one_liner: str) -> list[str]:
+    entities = []
+    for match in ENTITY.findall(one_liner):
+        normalized = _normalize(match)
+        if normalized.strip() and normalized.strip() not in PRONOUNS:
+            entities.append(normalized)
+    return entities
+
+
+def match_claim(claim: Claim, content: str) -> str | None:
+    """
+    Confirm a claim from the source text without an LLM.
+
+    Returns the reasoning when the claim (of at least MIN_VERBATIM_TERMS
+    content words) appears verbatim in the source, or, for factual claim
+    types, when all its named entities and nearly all its content words
+    appear within a couple of sentences. Either way the matching window
+    must not contain a negation.
+    Returns None when unsure; the claim then goes to the LLM fact-checker.
+    A claim is never rejected here.
+    """
+    normalized_claim = _normalize(claim.one_liner)
+    windows = _sentence_windows(content)
+    terms = {token for token in tokenize(claim.one_liner) if token not in STOPWORDS}
+
+    if len(terms) >= MIN_VERBATIM_TERMS and any(
+        normalized_claim in window and not set(window.split()) & NEGATIONS
+        for window in windows
+    ):
+        return "Claim text appears verbatim in the source"
+
+    if claim.type not in ENTITY_CLAIM_TYPES:
+        return None
+    entities = _entities(claim.one_liner)
+    if not entities or not terms:
+        return None
+
+    for window in windows:
+        if not all(entity in window for entity in entities):
+            continue
+        tokens = set(window.split())
+        if tokens & NEGATIONS:
+            continue
+        if len(terms & tokens) >= MIN_TERM_COVERAGE * len(terms):
+            names = ", ".join(entity.strip() for entity in entities)
+            return f"Source mentions {names} as claimed"
+    return None
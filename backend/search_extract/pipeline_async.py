@@ -1,77 +1,151 @@
 import asyncio
-from collections.abc import Callable
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
+from functools import partial
+from typing import Any
 
-from firecrawl import Firecrawl
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from config import settings
 from crawling.schemas import (
     Claim,
+    ClaimVerificationAnalysis,
     ClaimVerified,
+    GroupedVerificationAnalysis,
     PersonClaims,
     PersonClaimsVerified,
     VerificationAnalysis,
 )
+from search_extract import local_verifier, preprocess, relevance, retrieval
+from search_extract.dedup import ClaimCluster, ClaimClusters
+from search_extract.events import (
+    ClaimChecked,
+    Emit,
+    EventChannel,
+    LogLine,
+    PageExtracted,
+    Stage,
+    StageProgress,
+    print_event,
+)
 from search_extract.schemas import CollectedPage, ExtractedPage, SearchResult
+from search_extract.sources import SourceContent
+from search_extract.urls import canonicalize_url
+from services import llm_cache, search_cache
+from services.clients import Clients
 from services.extraction_task import LogType
+from services.firecrawl_client import FirecrawlClient
+from services.rate_limit import estimate_tokens, limiter
+
+logger = logging.getLogger(__name__)
 
 MAX_CONTENT_LENGTH = 15000
 
+MODEL = "gpt-5-nano"
+
+# Bump when a prompt's meaning changes to invalidate cached LLM responses
+EXTRACT_PROMPT_VERSION = "1"
+VERIFY_PROMPT_VERSION = "1"
+
+EXTRACT_PROMPT = """
+Return ONLY JSON matching this schema:
+- person_name: the person's full name
+- claims: list of objects with:
+  - type (interest, hobby, passion, community, culture, media, sports_team,
+          prior_employer, education, location, language, other)
+  - one_liner (single short sentence)
+  - url (direct supporting link)
+  - notes (optional)
+
+Rules:
+- High volume is preferred: include hobbies, interests, side projects, tools, communities,
+  favorite media, sports, background, and any unique personal details.
+- Every claim MUST include a URL. If no URL exists, skip it.
+- Avoid sensitive topics (politics, religion, health, family).
+- Output only the JSON object, nothing else.
+"""
 
-LogCallback = Callable[[str, LogType, int | None], None]
+VERIFY_INSTRUCTIONS = "You are a fact-checker. Determine if the claim is supported by the source content. Be strict - the claim must be directly or clearly supported by the text."
 
+GROUP_VERIFY_INSTRUCTIONS = (
+    "You are a fact-checker. For each numbered claim, determine if it is "
+    "supported by the source content. Be strict - a claim must be directly or "
+    "clearly supported by the text. Return exactly one result per claim, using "
+    "its number as claim_id."
+)
 
-def _noop_log(message: str, log_type: LogType = LogType.INFO, progress: int | None = None):
-    print(f"[{log_type.value}] {message}")
+GROUP_VERIFY_QUESTION = (
+    "Analyze each claim separately: is it directly supported, partially "
+    "supported, or not found in the source content?"
+)
 
 
 async def run_extraction_pipeline(
     db: AsyncIOMotorDatabase,
+    clients: Clients,
     query: str,
     campaign_id: str,
-    log: LogCallback = _noop_log,
+    events: EventChannel | None = None,
     limit: int = 10,
+    scrape_concurrency: int | None = None,
+    extract_concurrency: int | None = None,
+    verify_concurrency: int | None = None,
 ) -> str:
     """
-    Full extraction pipeline: search -> collect -> extract -> verify -> save.
+    Full extraction pipeline: search -> scrape -> extract -> verify -> save.
     Returns the verified_claims document ID.
+
+    Scrape, extract and verify run as queue-connected stages, so claims
+    from the first page are verified while later pages are still being
+    scraped. The *_concurrency arguments cap the workers of each stage for
+    this run (default to the matching settings).
+
+    Progress is published as typed events on `events`, in order; without
+    a channel they are printed.
     """
-    firecrawl = Firecrawl(api_key=settings.firecrawl_api_key)
-    openai_client = OpenAI(api_key=settings.openai_api_key)
+    emit = events.emit if events else print_event
+    firecrawl = clients.firecrawl
+    openai_client = clients.openai
+    sources = SourceContent(firecrawl, db)
+    started = time.monotonic()
 
     # Step 1: Search
-    log(f"Searching for: {query}", LogType.INFO)
-    results = await asyncio.to_thread(_search, firecrawl, query, limit)
-    log(f"Found {len(results)} results", LogType.SUCCESS)
+    emit(LogLine(f"Searching for: {query}", LogType.INFO))
+    results = await _cached_search(db, firecrawl, query, limit, emit)
+    emit(LogLine(f"Found {len(results)} results", LogType.SUCCESS))
 
     if not results:
         raise ValueError("No search results found")
 
-    # Step 2: Collect pages
-    log("Collecting pages...", LogType.INFO)
-    pages = []
-    for i, result in enumerate(results, 1):
-        progress = int((i / len(results)) * 33)
-        log(f"Scraping page {i}/{len(results)}: {result.url[:50]}...", LogType.PROGRESS, progress)
-        page = await asyncio.to_thread(_scrape_page, firecrawl, result)
-        if page:
-            pages.append(page)
+    if settings.relevance_filter_enabled:
+        results = _filter_results(results, query, emit)
+
+    # Steps 2-4: Scrape, extract and verify, pipelined
+    emit(LogLine("Scraping, extracting and verifying pages...", LogType.INFO))
+    stages = _Stages(
+        sources,
+        openai_client,
+        query,
+        results,
+        emit,
+        grouped=settings.verification_mode == "grouped",
+    )
+    await stages.run(
+        scrape_concurrency or settings.scrape_concurrency,
+        extract_concurrency or settings.extract_concurrency,
+        verify_concurrency or settings.verify_concurrency,
+    )
 
-    log(f"Collected {len(pages)} pages", LogType.SUCCESS)
+    emit(LogLine(f"Collected {len(stages.pages)} pages", LogType.SUCCESS))
 
-    if not pages:
+    if not stages.pages:
         raise ValueError("Failed to collect any pages")
 
-    # Step 3: Extract claims from pages
-    log("Extracting claims...", LogType.INFO)
-    extracted = []
-    for i, page in enumerate(pages, 1):
-        progress = 33 + int((i / len(pages)) * 33)
-        log(f"Extracting from page {i}/{len(pages)}", LogType.PROGRESS, progress)
-        result = await asyncio.to_thread(_extract_from_page, openai_client, page, query)
-        extracted.append(result)
+    extracted = stages.extracted_pages()
 
     # Save raw extraction
     extraction_doc = {
@@ -82,40 +156,10 @@ async def run_extraction_pipeline(
     }
     extraction_result = await db.extractions.insert_one(extraction_doc)
     extraction_id = str(extraction_result.inserted_id)
-    log(f"Saved raw extraction: {extraction_id}", LogType.SUCCESS)
-
-    # Step 4: Verify claims
-    log("Verifying claims...", LogType.INFO)
-    all_verified: list[dict] = []
-
-    for page in extracted:
-        data = page.data
-        if not data or page.error:
-            continue
-
-        person_name = data.get("person_name", "Unknown")
-        claims_data = data.get("claims", [])
-
-        if not claims_data:
-            continue
-
-        verified_claims = []
-        for i, claim_data in enumerate(claims_data, 1):
-            progress = 66 + int((i / len(claims_data)) * 33)
-            claim = Claim(**claim_data)
-            log(f"Verifying claim {i}/{len(claims_data)}: {claim.one_liner[:40]}...", LogType.PROGRESS, progress)
-
-            verified = await asyncio.to_thread(_verify_claim, firecrawl, openai_client, claim)
-            verified_claims.append(verified)
-
-            status = "✓" if verified.is_supported else "✗"
-            log_type = LogType.SUCCESS if verified.is_supported else LogType.ERROR
-            log(f"{status} {verified.reasoning[:60]}", log_type)
-
-        person_verified = PersonClaimsVerified(person_name=person_name, claims=verified_claims)
-        all_verified.append(person_verified.model_dump())
+    emit(LogLine(f"Saved raw extraction: {extraction_id}", LogType.SUCCESS))
 
     # Save verified claims
+    all_verified = stages.verified_persons()
     verified_doc = {
         "query": query,
         "campaign_id": campaign_id,
@@ -132,113 +176,671 @@ async def run_extraction_pipeline(
         sum(1 for c in p.get("claims", []) if c.get("is_supported"))
         for p in all_verified
     )
-    log(f"Verification complete: {verified_count}/{total_claims} claims verified", LogType.SUCCESS, 100)
+    locally_verified = sum(
+        sum(1 for c in p.get("claims", []) if c.get("verified_by") == "local")
+        for p in all_verified
+    )
+    emit(
+        LogLine(
+            f"Settled {locally_verified}/{total_claims} claims without an LLM call",
+            LogType.INFO,
+        )
+    )
+    if stages.duplicate_claims:
+        emit(
+            LogLine(
+                f"Merged {stages.duplicate_claims} duplicate claims across pages",
+                LogType.INFO,
+            )
+        )
+    emit(
+        LogLine(
+            f"Used {sources.fetch_count} distinct sources "
+            f"({sources.cache_hits} from scrape cache)",
+            LogType.INFO,
+        )
+    )
+    if stages.first_verified_at is not None:
+        first_verified = stages.first_verified_at - started
+        emit(
+            LogLine(
+                f"Finished in {time.monotonic() - started:.1f}s "
+                f"(first claim verified after {first_verified:.1f}s)",
+                LogType.INFO,
+            )
+        )
+    emit(
+        LogLine(
+            f"Verification complete: {verified_count}/{total_claims} claims verified",
+            LogType.SUCCESS,
+            100,
+        )
+    )
 
     return verified_id
 
 
-def _search(firecrawl: Firecrawl, query: str, limit: int) -> list[SearchResult]:
-    response = firecrawl.search(query, limit=limit)
-    results = []
-    for item in response.web or []:
-        results.append(SearchResult(
-            url=item.url,
-            title=item.title,
-            description=item.description,
-        ))
+async def _cached_search(
+    db: AsyncIOMotorDatabase,
+    firecrawl: FirecrawlClient,
+    query: str,
+    limit: int,
+    emit: Emit,
+) -> list[SearchResult]:
+    cached = await search_cache.get_cached_search(db, query, limit)
+    if cached:
+        results, age = cached
+        emit(
+            LogLine(
+                f"Using cached search results ({search_cache.format_age(age)} old)",
+                LogType.INFO,
+            )
+        )
+        return results
+
+    results = await _search(firecrawl, query, limit)
+    if results:
+        await search_cache.store_search(db, query, limit, results)
     return results
 
 
-def _scrape_page(firecrawl: Firecrawl, result: SearchResult) -> CollectedPage | None:
+def _filter_results(
+    results: list[SearchResult], query: str, emit: Emit
+) -> list[SearchResult]:
+    kept, dropped = relevance.filter_results(results, query)
+    for result, score in dropped:
+        emit(
+            LogLine(f"Skipping {result.url[:50]} (relevance {score:.2f})", LogType.INFO)
+        )
+    if dropped:
+        emit(
+            LogLine(
+                f"Kept {len(kept)}/{len(results)} results after relevance filter",
+                LogType.INFO,
+            )
+        )
+    return kept
+
+
+async def _search(
+    firecrawl: FirecrawlClient, query: str, limit: int
+) -> list[SearchResult]:
+    return await firecrawl.search(query, limit=limit)
+
+
+# Marks the end of a stage queue; each worker puts it back for its siblings
+_DONE = object()
+
+VerificationUnit = list[tuple[int, Claim]]
+
+
+async def _run_workers(
+    inbox: asyncio.Queue, concurrency: int, handle: Callable[[Any], Awaitable[None]]
+) -> None:
+    """Run concurrency workers that handle items from inbox until _DONE."""
+
+    async def worker() -> None:
+        while (item := await inbox.get()) is not _DONE:
+            await handle(item)
+        inbox.put_nowait(_DONE)
+
+    async with asyncio.TaskGroup() as group:
+        for _ in range(max(1, concurrency)):
+            group.create_task(worker())
+
+
+class _Stages:
+    """
+    Scrape, extract and verify stages of one pipeline run, connected by
+    queues. Each stage has its own worker pool and progress counter;
+    results are kept by search rank so output order matches the
+    sequential pipeline. A duplicate claim is verified as soon as its
+    first copy is extracted; a copy from a higher-ranked page that arrives
+    later is verified too, and the highest-ranked copy's result is kept,
+    so output does not depend on timing.
+    """
+
+    def __init__(
+        self,
+        sources: SourceContent,
+        openai_client: AsyncOpenAI,
+        query: str,
+        results: list[SearchResult],
+        emit: Emit,
+        grouped: bool,
+    ):
+        self._sources = sources
+        self._openai = openai_client
+        self._query = query
+        self._results = results
+        self._emit = emit
+        self._grouped = grouped
+
+        # Keyed by search rank
+        self.pages: dict[int, CollectedPage] = {}
+        self._extracted: dict[int, ExtractedPage] = {}
+        self._persons: dict[int, PersonClaims] = {}
+        self._verified: dict[int, list[ClaimVerified | None]] = {}
+        self._claim_clusters: dict[int, list[ClaimCluster]] = {}
+        # Cluster (by id) -> best search rank of a copy queued for verification
+        self._best_rank: dict[int, int] = {}
+
+        # Claims whose source was unusable, retried on their duplicates'
+        # URLs once every page is extracted
+        self._unresolved: list[tuple[int, int, Claim, ClaimVerified]] = []
+
+        # Near-duplicate claims across pages are verified once
+        self._clusters = ClaimClusters()
+
+        self._scraped_count = 0
+        self._claim_count = 0
+        self._verified_count = 0
+        self._progress = 0
+        self.first_verified_at: float | None = None
+
+    async def run(
+        self, scrape_concurrency: int, extract_concurrency: int, verify_concurrency: int
+    ) -> None:
+        search_results: asyncio.Queue = asyncio.Queue()
+        to_extract: asyncio.Queue = asyncio.Queue()
+        to_verify: asyncio.Queue = asyncio.Queue()
+        for item in enumerate(self._results):
+            search_results.put_nowait(item)
+        search_results.put_nowait(_DONE)
+
+        async def scrape_stage() -> None:
+            await _run_workers(
+                search_results,
+                scrape_concurrency,
+                lambda item: self._scrape(*item, to_extract),
+            )
+            to_extract.put_nowait(_DONE)
+
+        async def extract_stage() -> None:
+            await _run_workers(
+                to_extract,
+                extract_concurrency,
+                lambda item: self._extract(*item, to_verify),
+            )
+            to_verify.put_nowait(_DONE)
+
+        async with asyncio.TaskGroup() as group:
+            group.create_task(scrape_stage())
+            group.create_task(extract_stage())
+            group.create_task(_run_workers(to_verify, verify_concurrency, self._verify))
+
+        to_retry: asyncio.Queue = asyncio.Queue()
+        for item in sorted(self._unresolved, key=lambda item: item[:2]):
+            to_retry.put_nowait(item)
+        to_retry.put_nowait(_DONE)
+        await _run_workers(to_retry, verify_concurrency, self._verify_alternates)
+
+    async def _scrape(
+        self, rank: int, result: SearchResult, to_extract: asyncio.Queue
+    ) -> None:
+        page = await _scrape_page(self._sources, result)
+        self._scraped_count += 1
+        if page:
+            self.pages[rank] = page
+            to_extract.put_nowait((rank, page))
+        self._report(
+            "scrape", self._scraped_count, len(self._results), f"{result.url[:50]}..."
+        )
+
+    async def _extract(
+        self, rank: int, page: CollectedPage, to_verify: asyncio.Queue
+    ) -> None:
+        name, _ = relevance.split_query(self._query)
+        prepared = preprocess.prepare(page.markdown, name, MAX_CONTENT_LENGTH)
+        extracted = await _extract_from_page(
+            self._openai, page.url, prepared.text, self._query
+        )
+        self._extracted[rank] = extracted
+        person = _page_person(extracted)
+        claim_count = len(person.claims) if person else 0
+        merged = 0
+        if person:
+            person, clusters = self._merge_duplicates(rank, person)
+            merged = claim_count - len(person.claims)
+        if person and person.claims:
+            self._persons[rank] = person
+            self._verified[rank] = [None] * len(person.claims)
+            self._claim_clusters[rank] = clusters
+            self._claim_count += len(person.claims)
+            for unit in _verification_units(person, self._grouped):
+                to_verify.put_nowait((rank, unit))
+        self._emit(
+            PageExtracted(
+                page.url,
+                claim_count,
+                merged,
+                prepared.chars_before,
+                prepared.chars_after,
+            )
+        )
+        self._report(
+            "extract",
+            len(self._extracted),
+            len(self.pages),
+            f"{claim_count} claims{f', {merged} already seen' if merged else ''} "
+            f"({prepared.chars_before:,} -> {prepared.chars_after:,} chars)",
+        )
+
+    def _merge_duplicates(
+        self, rank: int, person: PersonClaims
+    ) -> tuple[PersonClaims, list[ClaimCluster]]:
+        """
+        Drop claims that duplicate one already queued for verification from
+        an equal or higher-ranked page; their URLs become the
+        representative's alternate sources.
+        """
+        claims = []
+        clusters = []
+        for claim in person.claims:
+            cluster, _ = self._clusters.add(claim)
+            if rank < self._best_rank.get(id(cluster), len(self._results)):
+                self._best_rank[id(cluster)] = rank
+                claims.append(claim)
+                clusters.append(cluster)
+        return person.model_copy(update={"claims": claims}), clusters
+
+    async def _verify(self, item: tuple[int, VerificationUnit]) -> None:
+        rank, unit = item
+        claims = [claim for _, claim in unit]
+        if self._grouped:
+            verified_claims = await _verify_claim_group(
+                self._sources, self._openai, claims
+            )
+        else:
+            verified_claims = [
+                await _verify_claim(self._sources, self._openai, claims[0])
+            ]
+
+        if self.first_verified_at is None:
+            self.first_verified_at = time.monotonic()
+        for (claim_index, claim), verified in zip(unit, verified_claims, strict=True):
+            if verified.verified_by is None:
+                # Later pages may still add duplicates with other URLs
+                self._unresolved.append((rank, claim_index, claim, verified))
+            else:
+                self._record(rank, claim_index, claim, verified)
+
+    async def _verify_alternates(
+        self, item: tuple[int, int, Claim, ClaimVerified]
+    ) -> None:
+        """Retry a claim whose source was unusable against its duplicates' URLs."""
+        rank, claim_index, claim, verified = item
+        cluster = self._claim_clusters[rank][claim_index]
+        # Superseded by a higher-ranked copy, whose result is the one kept
+        superseded = self._best_rank[id(cluster)] < rank
+        for url in [] if superseded else cluster.alternates(claim.url):
+            alternate = await _verify_claim(
+                self._sources, self._openai, claim.model_copy(update={"url": url})
+            )
+            if alternate.verified_by is not None:
+                verified = alternate
+                break
+        self._record(rank, claim_index, claim, verified)
+
+    def _record(
+        self, rank: int, claim_index: int, claim: Claim, verified: ClaimVerified
+    ) -> None:
+        self._verified[rank][claim_index] = verified
+        self._verified_count += 1
+        # The ✓/✗ line carries verify progress; a separate progress line
+        # would be flushed by it every time and never coalesce
+        self._emit(ClaimChecked(claim, verified, self._advance()))
+
+    @property
+    def duplicate_claims(self) -> int:
+        return self._clusters.duplicates
+
+    def _report(self, stage: Stage, done: int, total: int, detail: str) -> None:
+        """Publish a stage progress event."""
+        self._emit(StageProgress(stage, done, total, self._advance(), detail))
+
+    def _advance(self) -> int:
+        """
+        Recompute overall progress. Each stage gets a third; a later stage's
+        share is scaled by how much of its input has arrived, and the value
+        never moves backwards as new work is discovered.
+        """
+        scraped = self._scraped_count / len(self._results)
+        extracted = scraped * len(self._extracted) / max(1, len(self.pages))
+        verified = extracted * self._verified_count / max(1, self._claim_count)
+        self._progress = max(self._progress, int((scraped + extracted + verified) * 33))
+        return self._progress
+
+    def extracted_pages(self) -> list[ExtractedPage]:
+        return [self._extracted[rank] for rank in sorted(self._extracted)]
+
+    def verified_persons(self) -> list[dict]:
+        """
+        Verified claims by page, in search-rank order. A duplicate claim
+        appears once, under the highest-ranked page it was extracted from.
+        """
+        placed: set[int] = set()
+        persons = []
+        for rank in sorted(self._persons):
+            claims = []
+            for verified, cluster in zip(
+                self._verified[rank], self._claim_clusters[rank], strict=True
+            ):
+                if id(cluster) in placed:
+                    continue
+                placed.add(id(cluster))
+                claims.append(
+                    verified.model_copy(
+                        update={"alternate_urls": cluster.alternates(verified.url)}
+                    )
+                )
+            if claims:
+                persons.append(
+                    PersonClaimsVerified(
+                        person_name=self._persons[rank].person_name, claims=claims
+                    ).model_dump()
+                )
+        return persons
+
+
+def _page_person(page: ExtractedPage) -> PersonClaims | None:
+    """The person extracted from a page, if it has claims to verify."""
+    data = page.data
+    if not data or page.error:
+        return None
+
+    claims_data = data.get("claims", [])
+    if not claims_data:
+        return None
+
+    return PersonClaims(
+        person_name=data.get("person_name", "Unknown"),
+        claims=[Claim(**claim_data) for claim_data in claims_data],
+    )
+
+
+def _verification_units(person: PersonClaims, grouped: bool) -> list[VerificationUnit]:
+    """
+    Split a person's claims into units of work as (claim index, claim).
+    Grouped mode batches claims citing the same source into one unit.
+    """
+    claims = list(enumerate(person.claims))
+    if not grouped:
+        return [[item] for item in claims]
+
+    by_source: dict[str, VerificationUnit] = {}
+    for item in claims:
+        by_source.setdefault(canonicalize_url(item[1].url), []).append(item)
+
+    size = max(1, settings.max_claims_per_group)
+    return [
+        group[start : start + size]
+        for group in by_source.values()
+        for start in range(0, len(group), size)
+    ]
+
+
+async def _scrape_page(
+    sources: SourceContent, result: SearchResult
+) -> CollectedPage | None:
     try:
-        response = firecrawl.scrape(result.url, formats=["markdown"])
-        markdown = response.markdown or ""
+        markdown = await sources.get(result.url)
         return CollectedPage(url=result.url, markdown=markdown, title=result.title)
     except Exception as e:
         print(f"Failed to scrape {result.url}: {e}")
         return None
 
 
-def _extract_from_page(openai_client: OpenAI, page: CollectedPage, query: str) -> ExtractedPage:
-    prompt = """
-Return ONLY JSON matching this schema:
-- person_name: the person's full name
-- claims: list of objects with:
-  - type (interest, hobby, passion, community, culture, media, sports_team,
-          prior_employer, education, location, language, other)
-  - one_liner (single short sentence)
-  - url (direct supporting link)
-  - notes (optional)
+async def _extract_from_page(
+    openai_client: AsyncOpenAI, url: str, content: str, query: str
+) -> ExtractedPage:
+    """Extract claims from a page's preprocessed content."""
+    messages = [
+        {
+            "role": "system",
+            "content": f"{EXTRACT_PROMPT}\n\nExtract information about the person from: {query}",
+        },
+        {
+            "role": "user",
+            "content": f"URL: {url}\n\nContent:\n{content}",
+        },
+    ]
+
+    async def parse() -> PersonClaims | None:
+        response = await limiter.call(
+            "openai",
+            MODEL,
+            partial(
+                openai_client.beta.chat.completions.parse,
+                model=MODEL,
+                messages=messages,
+                response_format=PersonClaims,
+            ),
+            tokens=estimate_tokens(*(message["content"] for message in messages)),
+        )
+        return response.choices[0].message.parsed
 
-Rules:
-- High volume is preferred: include hobbies, interests, side projects, tools, communities,
-  favorite media, sports, background, and any unique personal details.
-- Every claim MUST include a URL. If no URL exists, skip it.
-- Avoid sensitive topics (politics, religion, health, family).
-- Output only the JSON object, nothing else.
-"""
     try:
-        content = page.markdown[:MAX_CONTENT_LENGTH]
-        response = openai_client.beta.chat.completions.parse(
-            model="gpt-5-nano",
-            messages=[
-                {
-                    "role": "system",
-                    "content": f"{prompt}\n\nExtract information about the person from: {query}",
-                },
-                {
-                    "role": "user",
-                    "content": f"URL: {page.url}\n\nContent:\n{content}",
-                },
-            ],
-            response_format=PersonClaims,
-        )
-        parsed = response.choices[0].message.parsed
+        parsed = await llm_cache.cached_parse(
+            "extract_page",
+            MODEL,
+            EXTRACT_PROMPT_VERSION,
+            PersonClaims,
+            json.dumps(messages),
+            parse,
+        )
         return ExtractedPage(
-            url=page.url,
+            url=url,
             data=parsed.model_dump() if parsed else None,
         )
     except Exception as e:
-        return ExtractedPage(url=page.url, data=None, error=str(e))
+        return ExtractedPage(url=url, data=None, error=str(e))
 
 
-def _verify_claim(firecrawl: Firecrawl, openai_client: OpenAI, claim: Claim) -> ClaimVerified:
+async def _fetch_claim_source(
+    sources: SourceContent, claims: list[Claim]
+) -> tuple[str | None, list[ClaimVerified]]:
+    """
+    Resolve the source content shared by claims. Returns the content, or
+    None together with the unsupported results when the source is unusable.
+    """
     try:
-        response = firecrawl.scrape(str(claim.url), formats=["markdown"])
-        content = response.markdown
+        content = await sources.get(str(claims[0].url))
     except Exception as e:
-        return ClaimVerified(
+        reasoning = f"Could not access source: {e}"
+    else:
+        if content:
+            return content, []
+        reasoning = "Empty content from source"
+
+    return None, [
+        ClaimVerified(
             **claim.model_dump(mode="python"),
             is_supported=False,
-            reasoning=f"Could not access source: {e}",
+            reasoning=reasoning,
         )
+        for claim in claims
+    ]
+
+
+async def _verify_claim(
+    sources: SourceContent, openai_client: AsyncOpenAI, claim: Claim
+) -> ClaimVerified:
+    content, unsupported = await _fetch_claim_source(sources, [claim])
+    if content is None:
+        return unsupported[0]
+
+    return _match_locally(claim, content) or await _check_claim(
+        openai_client, claim, content
+    )
+
+
+async def _verify_claim_group(
+    sources: SourceContent, openai_client: AsyncOpenAI, claims: list[Claim]
+) -> list[ClaimVerified]:
+    """
+    Verify claims citing one source. Claims the local matcher confirms skip
+    the LLM; the rest share a single fact-check call, and claims the grouped
+    call fails to answer fall back to the per-claim check.
+    """
+    content, unsupported = await _fetch_claim_source(sources, claims)
+    if content is None:
+        return unsupported
+
+    local = [_match_locally(claim, content) for claim in claims]
+    pending = [
+        claim for claim, verified in zip(claims, local, strict=True) if verified is None
+    ]
+
+    if len(pending) == 1:
+        checked = [await _check_claim(openai_client, pending[0], content)]
+    elif pending:
+        checked = await _check_pending_group(openai_client, pending, content)
+    else:
+        checked = []
+
+    remaining = iter(checked)
+    return [verified or next(remaining) for verified in local]
+
 
-    if not content:
+async def _check_pending_group(
+    openai_client: AsyncOpenAI, claims: list[Claim], content: str
+) -> list[ClaimVerified]:
+    try:
+        analyses = await _check_claim_group(openai_client, claims, content)
+    except Exception as e:
+        logger.warning(f"Grouped verification failed for {claims[0].url}: {e}")
+        analyses = {}
+
+    async def resolve(claim_id: int, claim: Claim) -> ClaimVerified:
+        analysis = analyses.get(claim_id)
+        if analysis is None:
+            return await _check_claim(openai_client, claim, content)
         return ClaimVerified(
             **claim.model_dump(mode="python"),
-            is_supported=False,
-            reasoning="Empty content from source",
+            is_supported=analysis.is_supported,
+            reasoning=analysis.reasoning,
+            verified_by="llm",
         )
 
-    try:
-        response = openai_client.responses.parse(
-            model="gpt-5-nano",
-            instructions="You are a fact-checker. Determine if the claim is supported by the source content. Be strict - the claim must be directly or clearly supported by the text.",
-            input=f"""
+    return list(
+        await asyncio.gather(
+            *(resolve(claim_id, claim) for claim_id, claim in enumerate(claims, 1))
+        )
+    )
+
+
+def _match_locally(claim: Claim, content: str) -> ClaimVerified | None:
+    """Confirm a claim with the deterministic matcher, or None to escalate."""
+    if not settings.local_verification_enabled:
+        return None
+    reasoning = local_verifier.match_claim(claim, content)
+    if reasoning is None:
+        return None
+    return ClaimVerified(
+        **claim.model_dump(mode="python"),
+        is_supported=True,
+        reasoning=reasoning,
+        verified_by="local",
+    )
+
+
+async def _check_claim_group(
+    openai_client: AsyncOpenAI, claims: list[Claim], content: str
+) -> dict[int, ClaimVerificationAnalysis]:
+    """Fact-check numbered claims against one source. Returns analyses by claim_id."""
+    numbered = "\n".join(
+        f"{claim_id}. {claim.one_liner}" for claim_id, claim in enumerate(claims, 1)
+    )
+    evidence = retrieval.passage_index(content).select(
+        [claim.one_liner for claim in claims], settings.verify_context_chars
+    )
+    verification_input = f"""
+CLAIMS:
+{numbered}
+
+SOURCE CONTENT:
+{evidence}
+
+{GROUP_VERIFY_QUESTION}
+"""
+
+    async def parse() -> GroupedVerificationAnalysis | None:
+        response = await limiter.call(
+            "openai",
+            MODEL,
+            partial(
+                openai_client.responses.parse,
+                model=MODEL,
+                instructions=GROUP_VERIFY_INSTRUCTIONS,
+                input=verification_input,
+                text_format=GroupedVerificationAnalysis,
+            ),
+            tokens=estimate_tokens(GROUP_VERIFY_INSTRUCTIONS, verification_input),
+        )
+        return response.output_parsed
+
+    grouped = await llm_cache.cached_parse(
+        "verify_claim_group",
+        MODEL,
+        VERIFY_PROMPT_VERSION,
+        GroupedVerificationAnalysis,
+        f"{GROUP_VERIFY_INSTRUCTIONS}\n{verification_input}",
+        parse,
+    )
+    if not grouped:
+        return {}
+    return {
+        analysis.claim_id: analysis
+        for analysis in grouped.results
+        if 1 <= analysis.claim_id <= len(claims)
+    }
+
+
+async def _check_claim(
+    openai_client: AsyncOpenAI, claim: Claim, content: str
+) -> ClaimVerified:
+    evidence = retrieval.passage_index(content).select(
+        [claim.one_liner], settings.verify_context_chars
+    )
+    verification_input = f"""
 CLAIM: {claim.one_liner}
 
 SOURCE CONTENT:
-{content[:15000]}
+{evidence}
 
 Analyze if the claim is directly supported, partially supported, or not found in the source content.
-""",
-            text_format=VerificationAnalysis,
+"""
+
+    async def parse() -> VerificationAnalysis | None:
+        response = await limiter.call(
+            "openai",
+            MODEL,
+            partial(
+                openai_client.responses.parse,
+                model=MODEL,
+                instructions=VERIFY_INSTRUCTIONS,
+                input=verification_input,
+                text_format=VerificationAnalysis,
+            ),
+            tokens=estimate_tokens(VERIFY_INSTRUCTIONS, verification_input),
+        )
+        return response.output_parsed
+
+    try:
+        verification = await llm_cache.cached_parse(
+            "verify_claim",
+            MODEL,
+            VERIFY_PROMPT_VERSION,
+            VerificationAnalysis,
+            f"{VERIFY_INSTRUCTIONS}\n{verification_input}",
+            parse,
         )
-        verification = response.output_parsed
         return ClaimVerified(
             **claim.model_dump(mode="python"),
             is_supported=verification.is_supported,
             reasoning=verification.reasoning,
+            verified_by="llm",
         )
     except Exception as e:
         return ClaimVerified(
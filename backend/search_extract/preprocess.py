@@ -0,0 +1,139 @@
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+
+from search_extract.relevance import STOPWORDS, tokenize
+
+IMAGE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+LINK = re.compile(r"\[([^\]]*)\]\((?:[^()\s]|\([^)]*\))*(?:\s+\"[^\"]*\")?\)")
+# Phrases that open a boilerplate line: cookie banners, sign-in prompts,
+# footers. Only matched at the start of a line, as whole words
+BOILERPLATE = re.compile(
+    r"[\W_]*(?:©|copyright\b|all rights reserved\b|privacy policy\b"
+    r"|terms of (?:service|use)\b|cookie (?:policy|settings|preferences)\b"
+    r"|(?:we|this (?:web)?site) uses? cookies\b|accept (?:all|cookies)\b"
+    r"|skip to (?:main )?content\b|sign (?:in|up)\b|log ?(?:in|out)\b"
+    r"|subscribe\b)",
+    re.IGNORECASE,
+)
+
+# Blocks shorter than this are dropped when every line is boilerplate
+BOILERPLATE_MAX_CHARS = 300
+# Blocks with at least this many links, mostly link text, are navigation
+LINK_LIST_MIN_LINKS = 3
+LINK_LIST_MIN_SHARE = 0.6
+# Longer blocks are split by line so windows stay fine-grained
+MAX_BLOCK_CHARS = 2000
+
+GAP = "[...]"
+
+
+@dataclass
+class PreparedText:
+    text: str
+    chars_before: int
+    chars_after: int
+
+
+def _blocks(markdown: str) -> list[str]:
+    blocks = []
+    for block in re.split(r"\n\s*\n", markdown):
+        if len(block) > MAX_BLOCK_CHARS:
+            blocks.extend(block.splitlines())
+        else:
+            blocks.append(block)
+    return blocks
+
+
+def _is_link_list(block: str) -> bool:
+    links = LINK.findall(block)
+    if len(links) < LINK_LIST_MIN_LINKS:
+        return False
+    visible = LINK.sub(r"\1", block)
+    link_chars = sum(len(text) for text in links)
+    return link_chars >= LINK_LIST_MIN_SHARE * len(visible.strip())
+
+
+def _is_boilerplate(block: str) -> bool:
+    if len(block) >= BOILERPLATE_MAX_CHARS:
+        return False
+    lines = [line for line in block.splitlines() if line.strip()]
+    return all(BOILERPLATE.match(line) for line in lines)
+
+
+@lru_cache(maxsize=64)
+def clean_markdown(markdown: str) -> str:
+    """
+    Strip what never helps the model: images, navigation link lists,
+    short boilerplate (cookie banners, sign-in prompts, footers) and
+    repeated blocks. Links are collapsed to their text.
+    """
+    markdown = IMAGE.sub("", markdown)
+    seen: set[str] = set()
+    kept = []
+    for block in _blocks(markdown):
+        if _is_link_list(block):
+            continue
+        block = LINK.sub(r"\1", block)
+        block = re.sub(r"[ \t]+", " ", block).strip()
+        if not re.search(r"\w", block):
+            continue
+        if _is_boilerplate(block):
+            continue
+        key = block.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        kept.append(block)
+    return "\n\n".join(kept)
+
+
+def prepare(markdown: str, terms: Iterable[str], max_chars: int) -> PreparedText:
+    """
+    Clean markdown and fit it into max_chars.
+
+    When the cleaned page is too long, blocks mentioning the most terms
+    (e.g. the person's name or a claim's words) are kept together with
+    their neighbouring blocks, then the remaining budget is filled from
+    the top of the page. Skipped stretches are marked with [...].
+    """
+    cleaned = clean_markdown(markdown)
+    if len(cleaned) <= max_chars:
+        return PreparedText(cleaned, len(markdown), len(cleaned))
+
+    blocks = cleaned.split("\n\n")
+    wanted = {term.lower() for term in terms} - STOPWORDS
+    scores = [len(wanted & set(tokenize(block))) for block in blocks]
+
+    chosen: set[int] = set()
+    size = 0
+
+    def take(index: int) -> None:
+        nonlocal size
+        cost = len(blocks[index]) + len(GAP) + 4
+        if index not in chosen and size + cost <= max_chars:
+            chosen.add(index)
+            size += cost
+
+    for index in sorted(range(len(blocks)), key=lambda i: (-scores[i], i)):
+        if not scores[index]:
+            break
+        for neighbour in (index, index - 1, index + 1):
+            if 0 <= neighbour < len(blocks):
+                take(neighbour)
+    for index in range(len(blocks)):
+        take(index)
+
+    if not chosen:
+        text = cleaned[:max_chars]
+    else:
+        parts = []
+        previous = -1
+        for index in sorted(chosen):
+            if index != previous + 1:
+                parts.append(GAP)
+            parts.append(blocks[index])
+            previous = index
+        text = "\n\n".join(parts)
+    return PreparedText(text, len(markdown), len(text))
@@ -0,0 +1,108 @@
+import re
+import unicodedata
+from urllib.parse import urlsplit
+
+from config import settings
+from search_extract.schemas import SearchResult
+
+# Lead queries start with the person's name, followed by company/role
+NAME_TOKENS = 2
+
+NAME_WEIGHT = 0.6
+CONTEXT_WEIGHT = 0.4
+
+# Score adjustment by domain (subdomains match too)
+DOMAIN_PRIORS = {
+    "linkedin.com": 0.2,
+    "github.com": 0.15,
+    "x.com": 0.1,
+    "twitter.com": 0.1,
+    "medium.com": 0.1,
+    "substack.com": 0.1,
+    "crunchbase.com": 0.05,
+    "youtube.com": 0.05,
+    # People-search and contact directories
+    "zoominfo.com": -0.4,
+    "rocketreach.co": -0.4,
+    "signalhire.com": -0.4,
+    "contactout.com": -0.4,
+    "lusha.com": -0.4,
+    "apollo.io": -0.3,
+    "spokeo.com": -0.5,
+    "whitepages.com": -0.5,
+    "peoplefinders.com": -0.5,
+    "beenverified.com": -0.5,
+    "truepeoplesearch.com": -0.5,
+    "radaris.com": -0.5,
+}
+
+STOPWORDS = {"a", "an", "and", "at", "for", "in", "of", "on", "the", "to", "with"}
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens with accents stripped."""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return re.findall(r"\w+", text.lower())
+
+
+def split_query(query: str) -> tuple[list[str], list[str]]:
+    """Split a lead query into name tokens and company/role tokens."""
+    tokens = [token for token in tokenize(query) if token not in STOPWORDS]
+    return tokens[:NAME_TOKENS], tokens[NAME_TOKENS:]
+
+
+def domain_prior(url: str) -> float:
+    host = (urlsplit(url).hostname or "").lower().removeprefix("www.")
+    for domain, prior in DOMAIN_PRIORS.items():
+        if host == domain or host.endswith(f".{domain}"):
+            return prior
+    return 0.0
+
+
+def score_result(result: SearchResult, query: str) -> float:
+    """
+    Relevance of a search result to a lead query, from 0 (unrelated) up.
+
+    Combines the share of name tokens and of company/role tokens found in
+    the result's title, description and URL, plus the domain prior.
+    """
+    name, context = split_query(query)
+    if not name:
+        return 1.0
+
+    text = " ".join(
+        part for part in (result.title, result.description, result.url) if part
+    )
+    found = set(tokenize(text))
+    name_score = sum(token in found for token in name) / len(name)
+    if context:
+        context_score = sum(token in found for token in context) / len(context)
+        score = NAME_WEIGHT * name_score + CONTEXT_WEIGHT * context_score
+    else:
+        score = name_score
+
+    return max(0.0, score + domain_prior(result.url))
+
+
+def filter_results(
+    results: list[SearchResult],
+    query: str,
+    min_score: float | None = None,
+    top_k: int | None = None,
+) -> tuple[list[SearchResult], list[tuple[SearchResult, float]]]:
+    """
+    Drop search results scoring below min_score and keep at most the top_k
+    best. Returns the kept results in search-rank order and the dropped
+    results with their scores. The best result is always kept.
+    """
+    min_score = settings.relevance_min_score if min_score is None else min_score
+    top_k = top_k or settings.relevance_top_k
+
+    scored = [(result, score_result(result, query)) for result in results]
+    ranked = sorted(range(len(scored)), key=lambda i: scored[i][1], reverse=True)
+    keep = {i for i in ranked[:top_k] if scored[i][1] >= min_score} or set(ranked[:1])
+
+    kept = [result for i, (result, _) in enumerate(scored) if i in keep]
+    dropped = [item for i, item in enumerate(scored) if i not in keep]
+    return kept, dropped
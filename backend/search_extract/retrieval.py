@@ -0,0 +1,114 @@
+import math
+from collections import Counter
+from functools import lru_cache
+
+from search_extract.preprocess import GAP, clean_markdown
+from search_extract.relevance import STOPWORDS, tokenize
+
+# Paragraphs are merged into passages of roughly this size
+PASSAGE_CHARS = 800
+
+# BM25 parameters
+K1 = 1.5
+B = 0.75
+
+
+def _terms(text: str) -> list[str]:
+    return [token for token in tokenize(text) if token not in STOPWORDS]
+
+
+def _chunk(text: str) -> list[str]:
+    passages: list[str] = []
+    current: list[str] = []
+    size = 0
+    for block in text.split("\n\n"):
+        if current and size + len(block) > PASSAGE_CHARS:
+            passages.append("\n\n".join(current))
+            current, size = [], 0
+        current.append(block)
+        size += len(block)
+    if current:
+        passages.append("\n\n".join(current))
+    return passages
+
+
+class PassageIndex:
+    """BM25 index over the paragraph passages of one cleaned source document."""
+
+    def __init__(self, markdown: str):
+        self.passages = _chunk(clean_markdown(markdown))
+        self._counts = [Counter(_terms(passage)) for passage in self.passages]
+        self._lengths = [sum(counts.values()) for counts in self._counts]
+        self._average_length = sum(self._lengths) / max(1, len(self._lengths))
+        document_frequency = Counter(term for counts in self._counts for term in counts)
+        total = len(self.passages)
+        self._idf = {
+            term: math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
+            for term, frequency in document_frequency.items()
+        }
+
+    def scores(self, query: str) -> list[float]:
+        terms = set(_terms(query))
+        scores = []
+        for counts, length in zip(self._counts, self._lengths, strict=True):
+            norm = K1 * (1 - B + B * length / max(1.0, self._average_length))
+            scores.append(
+                sum(
+                    self._idf[term] * counts[term] * (K1 + 1) / (counts[term] + norm)
+                    for term in terms
+                    if term in counts
+                )
+            )
+        return scores
+
+    def select(self, queries: list[str], max_chars: int) -> str:
+        """
+        Best passages for the queries within max_chars, in document order.
+        Queries take turns picking their next best passage, so each claim
+        of a group gets its evidence in. Falls back to the start of the
+        document when nothing matches.
+        """
+        rankings = []
+        for query in queries:
+            scores = self.scores(query)
+            rankings.append(
+                [
+                    index
+                    for index in sorted(
+                        range(len(scores)), key=lambda i: (-scores[i], i)
+                    )
+                    if scores[index] > 0
+                ]
+            )
+
+        chosen: set[int] = set()
+        size = 0
+        while any(rankings):
+            for ranking in rankings:
+                while ranking and ranking[0] in chosen:
+                    ranking.pop(0)
+                if not ranking:
+                    continue
+                index = ranking.pop(0)
+                cost = len(self.passages[index]) + len(GAP) + 4
+                if size + cost <= max_chars:
+                    chosen.add(index)
+                    size += cost
+
+        if not chosen:
+            return "\n\n".join(self.passages)[:max_chars]
+
+        parts = []
+        previous = -1
+        for index in sorted(chosen):
+            if index != previous + 1:
+                parts.append(GAP)
+            parts.append(self.passages[index])
+            previous = index
+        return "\n\n".join(parts)
+
+
+@lru_cache(maxsize=64)
+def passage_index(markdown: str) -> PassageIndex:
+    """Index for a source document, shared by every claim checked against it."""
+    return PassageIndex(markdown)
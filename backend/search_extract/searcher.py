@@ -1,13 +1,46 @@
+import asyncio
+
 from dotenv import load_dotenv
 from firecrawl import Firecrawl
+from motor.motor_asyncio import AsyncIOMotorClient
 
+from config import settings
 from search_extract.schemas import SearchResult
+from services import search_cache
 
 load_dotenv()
 
+# How long a lookup waits for Mongo before searching without the cache
+CACHE_TIMEOUT_MS = 2000
 
-def search(query: str, limit: int = 10) -> list[SearchResult]:
-    """Run a search query and return list of results."""
+
+async def _cached_search(query: str, limit: int) -> list[SearchResult]:
+    client = AsyncIOMotorClient(
+        settings.mongodb_uri, serverSelectionTimeoutMS=CACHE_TIMEOUT_MS
+    )
+    try:
+        try:
+            await client.admin.command("ping")
+        except Exception:
+            print("Search cache unavailable, searching without it")
+            return _search(query, limit)
+
+        db = client[settings.database_name]
+        cached = await search_cache.get_cached_search(db, query, limit)
+        if cached:
+            results, age = cached
+            print(f"Using cached search results ({search_cache.format_age(age)} old)")
+            return results
+
+        results = await asyncio.to_thread(_search, query, limit)
+        if results:
+            await search_cache.store_search(db, query, limit, results)
+        return results
+    finally:
+        client.close()
+
+
+def _search(query: str, limit: int) -> list[SearchResult]:
     firecrawl = Firecrawl()
 
     response = firecrawl.search(query, limit=limit)
@@ -19,5 +52,11 @@ def search(query: str, limit: int = 10) -> list[SearchResult]:
             title=item.title,
             description=item.description,
         ))
-
     return results
+
+
+def search(query: str, limit: int = 10, use_cache: bool = True) -> list[SearchResult]:
+    """Run a search query and return list of results."""
+    if use_cache and settings.mongodb_uri:
+        return asyncio.run(_cached_search(query, limit))
+    return _search(query, limit)
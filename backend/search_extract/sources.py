@@ -0,0 +1,53 @@
+import asyncio
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from config import settings
+from search_extract.urls import canonicalize_url
+from services import scrape_cache
+from services.firecrawl_client import FirecrawlClient
+
+
+class SourceContent:
+    """
+    Per-run map of canonical URL -> scraped markdown.
+
+    Shared by the collect and verify steps so each distinct source is
+    scraped at most once per pipeline run. Concurrent requests for the same
+    URL wait on the same in-flight scrape; a failed scrape is remembered
+    and re-raised to every caller. When a database is given, pages are read
+    from and written to the persistent scrape cache.
+    """
+
+    def __init__(
+        self, firecrawl: FirecrawlClient, db: AsyncIOMotorDatabase | None = None
+    ):
+        self._firecrawl = firecrawl
+        self._db = db if settings.scrape_cache_enabled else None
+        self._pages: dict[str, asyncio.Task[str]] = {}
+        self.cache_hits = 0
+
+    @property
+    def fetch_count(self) -> int:
+        return len(self._pages)
+
+    async def get(self, url: str) -> str:
+        key = canonicalize_url(url)
+        task = self._pages.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(url))
+            self._pages[key] = task
+        return await task
+
+    async def _fetch(self, url: str) -> str:
+        if self._db is not None:
+            cached = await scrape_cache.get_cached_page(self._db, url)
+            if cached is not None:
+                self.cache_hits += 1
+                return cached
+
+        markdown = await self._firecrawl.scrape(url)
+
+        if self._db is not None and markdown:
+            await scrape_cache.store_page(self._db, url, markdown)
+        return markdown
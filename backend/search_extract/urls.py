@@ -0,0 +1,27 @@
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that never change page content
+TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "mc_cid", "mc_eid", "ref", "ref_src"}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so trivially different spellings of one page share a key:
+    https scheme, lowercase host without "www.", no fragment, no tracking
+    parameters, sorted query string and no trailing slash.
+    """
+    parts = urlsplit(str(url).strip())
+    host = (parts.hostname or "").lower().removeprefix("www.")
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if key not in TRACKING_PARAMS and not key.startswith("utm_")
+        )
+    )
+    path = parts.path.rstrip("/")
+
+    return urlunsplit(("https", host, path, query, ""))
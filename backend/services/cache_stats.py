@@ -0,0 +1,16 @@
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    errors: int = 0
+
+    def to_dict(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            **asdict(self),
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+        }
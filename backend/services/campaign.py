@@ -4,6 +4,7 @@ from typing import Any
 
 from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
 
 from config import settings
 from schemas.campaign import (
@@ -193,6 +194,62 @@ async def append_leads_to_campaign(
         return False
 
 
+async def get_campaign_leads(
+    db: AsyncIOMotorDatabase, campaign_id: str
+) -> list[Lead] | None:
+    """A campaign's leads only, without loading the rest of the document."""
+    try:
+        doc = await db[COLLECTION].find_one(
+            {"_id": ObjectId(campaign_id)}, {"leads": 1}
+        )
+    except Exception:
+        return None
+
+    if not doc:
+        return None
+    return _parse_leads(doc.get("leads", []))
+
+
+async def mark_leads_processing(
+    db: AsyncIOMotorDatabase, campaign_id: str, task_ids: dict[str, str]
+) -> set[str]:
+    """
+    Set many leads to PROCESSING with their extraction task IDs (keyed by
+    lead ID) in one atomic update of the campaign. Leads already processing
+    are left alone, so overlapping batches never start a lead twice.
+    Returns the IDs of the leads this call marked.
+    """
+    if not task_ids:
+        return set()
+    updates: dict[str, Any] = {"updated_at": datetime.now(UTC)}
+    array_filters = []
+    for index, (lead_id, task_id) in enumerate(task_ids.items()):
+        updates[f"leads.$[l{index}].status"] = LeadStatus.PROCESSING.value
+        updates[f"leads.$[l{index}].extraction_task_id"] = task_id
+        array_filters.append(
+            {
+                f"l{index}.id": lead_id,
+                f"l{index}.status": {"$ne": LeadStatus.PROCESSING.value},
+            }
+        )
+    doc = await db[COLLECTION].find_one_and_update(
+        {"_id": ObjectId(campaign_id)},
+        {"$set": updates},
+        array_filters=array_filters,
+        projection={"leads.id": 1, "leads.extraction_task_id": 1},
+        return_document=ReturnDocument.AFTER,
+    )
+    if not doc:
+        return set()
+    # Task IDs are unique, so a lead carrying ours was marked by this call
+    return {
+        lead["id"]
+        for lead in doc.get("leads", [])
+        if lead.get("id") in task_ids
+        and lead.get("extraction_task_id") == task_ids[lead["id"]]
+    }
+
+
 async def update_lead_status(
     db: AsyncIOMotorDatabase,
     campaign_id: str,
@@ -0,0 +1,70 @@
+from functools import cached_property
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from reducto import AsyncReducto
+from reducto import DefaultAsyncHttpxClient as ReductoHttpxClient
+
+from config import settings
+from services.firecrawl_client import FirecrawlClient
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry_seconds,
+    )
+
+
+class Clients:
+    """
+    External service clients sharing keep-alive connection pools for the
+    lifetime of the app. SDK clients are built on first use, so a missing
+    API key only fails the calls that need it.
+    """
+
+    def __init__(self):
+        # Firecrawl and plain HTTP APIs (Resend)
+        self.http = httpx.AsyncClient(
+            limits=_limits(), timeout=settings.http_timeout_seconds
+        )
+        self.firecrawl = FirecrawlClient(self.http, settings.firecrawl_api_key)
+
+    @cached_property
+    def openai(self) -> AsyncOpenAI:
+        return AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=DefaultAsyncHttpxClient(limits=_limits()),
+            # Retries are owned by services.rate_limit
+            max_retries=0,
+        )
+
+    @cached_property
+    def reducto(self) -> AsyncReducto:
+        return AsyncReducto(
+            api_key=settings.reducto_api_key,
+            http_client=ReductoHttpxClient(limits=_limits()),
+        )
+
+    async def close(self) -> None:
+        if "openai" in self.__dict__:
+            await self.openai.close()
+        if "reducto" in self.__dict__:
+            await self.reducto.close()
+        await self.http.aclose()
+
+
+# Registry (initialized on startup)
+_clients: Clients | None = None
+
+
+def get_clients() -> Clients:
+    if _clients is None:
+        raise RuntimeError("Clients not initialized")
+    return _clients
+
+
+def set_clients(clients: Clients | None):
+    global _clients
+    _clients = clients
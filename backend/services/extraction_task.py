@@ -1,9 +1,25 @@
 import asyncio
+import logging
+import time
 import uuid
-from collections.abc import Callable
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from enum import Enum
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+import database
+from config import settings
+from database import ensure_ttl_index
+from services.sse import Event, format_event
+
+logger = logging.getLogger(__name__)
+
+# Log entries pushed out of a task's in-memory buffer (when spilling is on)
+SPILL_COLLECTION = "task_logs"
 
 
 class TaskStatus(str, Enum):
@@ -26,9 +42,15 @@ class LogEntry:
     message: str
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
     progress: int | None = None
+    # Position in the task's log, starting at 1; doubles as the SSE event ID
+    id: int = 0
+    # Encoded on first use, then shared by every subscriber and replay
+    _event: Event | None = field(default=None, repr=False, compare=False)
+    _campaign_event: Event | None = field(default=None, repr=False, compare=False)
 
     def to_dict(self) -> dict:
         result = {
+            "id": self.id,
             "type": self.type.value,
             "message": self.message,
             "timestamp": self.timestamp.isoformat(),
@@ -37,6 +59,28 @@ class LogEntry:
             result["progress"] = self.progress
         return result
 
+    def event(self) -> Event:
+        """The entry as a task stream event."""
+        if self._event is None:
+            self._event = Event(
+                "log",
+                format_event("log", self.to_dict(), self.id),
+                progress=self.type == LogType.PROGRESS,
+            )
+        return self._event
+
+    def campaign_event(self, task: "ExtractionTask") -> Event:
+        """The entry tagged with its task and lead, for campaign streams."""
+        if self._campaign_event is None:
+            data = {**self.to_dict(), "task_id": task.id, "lead_id": task.lead_id}
+            self._campaign_event = Event(
+                "log",
+                format_event("log", data, data["timestamp"]),
+                task_id=task.id,
+                progress=self.type == LogType.PROGRESS,
+            )
+        return self._campaign_event
+
 
 @dataclass
 class ExtractionTask:
@@ -46,10 +90,28 @@ class ExtractionTask:
     lead_id: str | None = None
     lead_index: int | None = None
     status: TaskStatus = TaskStatus.PENDING
-    logs: list[LogEntry] = field(default_factory=list)
+    # Most recent entries only; log_count counts every entry ever logged
+    logs: deque[LogEntry] = field(
+        default_factory=lambda: deque(maxlen=settings.task_log_buffer_size)
+    )
+    log_count: int = 0
     extraction_id: str | None = None
     error: str | None = None
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    finished_at: datetime | None = None
+    # Writes each log entry to durable storage (set for queued jobs)
+    persist_log: Callable[[dict], Awaitable[None]] | None = None
+    # Encoded complete/error events for task and campaign streams
+    terminal_event: Event | None = None
+    campaign_terminal_event: Event | None = None
+    # Progress coalescing: the latest held-back (message, progress), when
+    # the last progress line went out, the timer that flushes it and the
+    # flush the timer started
+    pending_progress: tuple[str, int | None] | None = field(default=None, repr=False)
+    last_progress_at: float = field(default=0.0, repr=False)
+    progress_flush: asyncio.TimerHandle | None = field(default=None, repr=False)
+    progress_flush_task: asyncio.Task | None = field(default=None, repr=False)
+    coalesced_progress: int = 0
 
     def add_log(
         self,
@@ -57,41 +119,139 @@ class ExtractionTask:
         log_type: LogType = LogType.INFO,
         progress: int | None = None,
     ) -> LogEntry:
-        entry = LogEntry(type=log_type, message=message, progress=progress)
+        self.log_count += 1
+        entry = LogEntry(
+            type=log_type, message=message, progress=progress, id=self.log_count
+        )
         self.logs.append(entry)
         return entry
 
 
+class Subscriber:
+    """
+    One stream client's view of a task (or a campaign's tasks): the history
+    it missed, then live events in a bounded buffer. Publishing never blocks;
+    when a client falls behind, progress lines superseded by a newer one
+    from the same task are coalesced away first, then the oldest log lines
+    dropped. Terminal events are always kept.
+    """
+
+    def __init__(self, history: list[Event], maxsize: int):
+        self._history = deque(history)
+        self._live: deque[Event] = deque()
+        self._maxsize = max(1, maxsize)
+        self._ready = asyncio.Event()
+        self._closed = False
+        self.dropped = 0
+
+    def close(self) -> None:
+        """No more events will come; get() returns None once drained."""
+        self._closed = True
+        self._ready.set()
+
+    def replay_first(self, events: list[Event]) -> None:
+        self._history.extendleft(reversed(events))
+
+    def put(self, event: Event) -> None:
+        if len(self._live) >= self._maxsize:
+            self._make_room()
+        self._live.append(event)
+        self._ready.set()
+
+    def _make_room(self) -> None:
+        logs = [i for i, event in enumerate(self._live) if not event.terminal]
+        latest_progress = {
+            self._live[i].task_id: i for i in logs if self._live[i].progress
+        }
+        superseded = [
+            i
+            for i in logs
+            if self._live[i].progress and latest_progress[self._live[i].task_id] != i
+        ]
+        victim = superseded[0] if superseded else (logs[0] if logs else None)
+        if victim is not None:
+            del self._live[victim]
+            self.dropped += 1
+
+    async def get(self) -> Event | None:
+        if self._history:
+            return self._history.popleft()
+        while not self._live:
+            if self._closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+        return self._live.popleft()
+
+    def empty(self) -> bool:
+        return not self._history and not self._live
+
+    def qsize(self) -> int:
+        return len(self._history) + len(self._live)
+
+
+def _bounded_history(events: list[Event], maxsize: int) -> list[Event]:
+    """
+    Trim a replay the way a live buffer is trimmed: terminal events are
+    kept, then the newest maxsize lines, skipping progress lines that a
+    later one from the same task supersedes.
+    """
+    kept = []
+    progressed = set()
+    lines = 0
+    for event in reversed(events):
+        if not event.terminal:
+            if lines >= maxsize or (event.progress and event.task_id in progressed):
+                continue
+            if event.progress:
+                progressed.add(event.task_id)
+            lines += 1
+        kept.append(event)
+    kept.reverse()
+    return kept
+
+
 # In-memory task storage
 _tasks: dict[str, ExtractionTask] = {}
 _task_events: dict[str, asyncio.Event] = {}
-_task_subscribers: dict[str, list[asyncio.Queue]] = {}
+_task_subscribers: dict[str, list[Subscriber]] = {}
+_campaign_subscribers: dict[str, list[Subscriber]] = {}
 
 
-def create_task(campaign_id: str, query: str) -> ExtractionTask:
-    task_id = str(uuid.uuid4())[:8]
-    task = ExtractionTask(id=task_id, campaign_id=campaign_id, query=query)
-    _tasks[task_id] = task
-    _task_events[task_id] = asyncio.Event()
-    _task_subscribers[task_id] = []
-    return task
+def new_task_id() -> str:
+    """Also the job document's _id, so it must stay unique for the job TTL."""
+    return uuid.uuid4().hex
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase) -> None:
+    """Index spilled log entries by task and expire them with a TTL."""
+    await db[SPILL_COLLECTION].create_index([("task_id", 1), ("seq", 1)])
+    await ensure_ttl_index(
+        db, SPILL_COLLECTION, "created_at", settings.task_log_spill_ttl_seconds
+    )
 
 
-def create_task_for_lead(
-    campaign_id: str, query: str, lead_id: str, lead_index: int
+def register_task(
+    task_id: str,
+    campaign_id: str,
+    query: str,
+    lead_id: str | None = None,
+    lead_index: int | None = None,
+    persist_log: Callable[[dict], Awaitable[None]] | None = None,
 ) -> ExtractionTask:
-    """Create extraction task for a specific lead with index for log prefixing."""
-    task_id = str(uuid.uuid4())[:8]
+    """Register a task created elsewhere (e.g. a queued job claimed by a worker)."""
+    evict_finished_tasks()
     task = ExtractionTask(
         id=task_id,
         campaign_id=campaign_id,
         query=query,
         lead_id=lead_id,
         lead_index=lead_index,
+        persist_log=persist_log,
     )
     _tasks[task_id] = task
     _task_events[task_id] = asyncio.Event()
-    _task_subscribers[task_id] = []
+    _task_subscribers.setdefault(task_id, [])
     return task
 
 
@@ -99,38 +259,181 @@ def get_task(task_id: str) -> ExtractionTask | None:
     return _tasks.get(task_id)
 
 
-async def subscribe_to_task(task_id: str) -> asyncio.Queue:
-    if task_id not in _task_subscribers:
-        _task_subscribers[task_id] = []
-    queue: asyncio.Queue = asyncio.Queue()
-    _task_subscribers[task_id].append(queue)
-
-    # Send existing logs
+def unregister_task(task_id: str) -> None:
+    """
+    Forget a task this process stopped running before it finished (its job
+    was handed back for a retry, or another worker took over the lease).
+    Status and stream requests then follow the job document instead.
+    """
+    task = _tasks.pop(task_id, None)
+    if task:
+        _cancel_progress_flush(task)
+    _task_events.pop(task_id, None)
+    for subscriber in _task_subscribers.pop(task_id, []):
+        subscriber.close()
+
+
+def evict_finished_tasks() -> int:
+    """
+    Forget tasks that finished more than task_ttl_seconds ago. Their status
+    stays available from the job queue. Returns the number evicted.
+    """
+    cutoff = datetime.now(UTC) - timedelta(seconds=settings.task_ttl_seconds)
+    expired = [
+        task_id
+        for task_id, task in _tasks.items()
+        if task.finished_at and task.finished_at < cutoff
+    ]
+    for task_id in expired:
+        _tasks.pop(task_id, None)
+        _task_events.pop(task_id, None)
+        _task_subscribers.pop(task_id, None)
+    return len(expired)
+
+
+async def _spill_log(task: ExtractionTask, entry: LogEntry) -> None:
+    if database.db_client is None:
+        return
+    try:
+        await database.get_database()[SPILL_COLLECTION].insert_one(
+            {
+                "task_id": task.id,
+                "seq": entry.id,
+                "entry": entry.to_dict(),
+                "created_at": datetime.now(UTC),
+            }
+        )
+    except Exception as e:
+        logger.warning(f"Failed to spill log entry for task {task.id}: {e}")
+
+
+async def _spilled_logs(task: ExtractionTask, after: int, before: int) -> list[dict]:
+    """Entries with after < ID < before that no longer fit in the buffer."""
+    if before <= after + 1 or not settings.task_log_spill_enabled:
+        return []
+    if database.db_client is None:
+        return []
+    try:
+        cursor = (
+            database.get_database()[SPILL_COLLECTION]
+            .find({"task_id": task.id, "seq": {"$gt": after, "$lt": before}})
+            .sort("seq", 1)
+        )
+        return [doc["entry"] async for doc in cursor]
+    except Exception as e:
+        logger.warning(f"Failed to load spilled logs for task {task.id}: {e}")
+        return []
+
+
+async def subscribe_to_task(task_id: str, last_event_id: int = 0) -> Subscriber:
+    """
+    Subscribe to a task's events, replaying only the log entries after
+    last_event_id (the ID of the last entry the client received).
+    """
     task = get_task(task_id)
+    history: list[Event] = []
+    buffered: list[LogEntry] = []
+    # Snapshot the buffer and register in one step, so no event falls between
     if task:
-        for log in task.logs:
-            await queue.put(("log", log.to_dict()))
-        if task.status == TaskStatus.COMPLETED:
-            await queue.put(("complete", {"extraction_id": task.extraction_id}))
-        elif task.status == TaskStatus.FAILED:
-            await queue.put(("error", {"message": task.error}))
-
-    return queue
-
+        buffered = [entry for entry in task.logs if entry.id > last_event_id]
+        history = [entry.event() for entry in buffered]
+        if task.terminal_event:
+            history.append(task.terminal_event)
+    subscriber = Subscriber(history, settings.sse_subscriber_buffer_size)
+    if not task:
+        # Unregistered since the caller looked it up
+        subscriber.close()
+        return subscriber
+    _task_subscribers.setdefault(task_id, []).append(subscriber)
 
-def unsubscribe_from_task(task_id: str, queue: asyncio.Queue) -> None:
+    if task:
+        # Older entries spilled to Mongo go ahead of the buffered ones
+        before = buffered[0].id if buffered else task.log_count + 1
+        spilled = await _spilled_logs(task, last_event_id, before)
+        subscriber.replay_first(
+            [
+                Event(
+                    "log",
+                    format_event("log", entry, entry.get("id")),
+                    progress=entry.get("type") == LogType.PROGRESS.value,
+                )
+                for entry in spilled
+            ]
+        )
+    return subscriber
+
+
+def unsubscribe_from_task(task_id: str, subscriber: Subscriber) -> None:
     if task_id in _task_subscribers:
         try:
-            _task_subscribers[task_id].remove(queue)
+            _task_subscribers[task_id].remove(subscriber)
         except ValueError:
             pass
 
 
-async def _notify_subscribers(task_id: str, event_type: str, data: dict) -> None:
-    if task_id not in _task_subscribers:
-        return
-    for queue in _task_subscribers[task_id]:
-        await queue.put((event_type, data))
+async def subscribe_to_campaign(
+    campaign_id: str, since: datetime | None = None
+) -> Subscriber:
+    """
+    Subscribe to events from every task of a campaign run in this process,
+    replaying what happened after `since` (all buffered history if None),
+    bounded like the live buffer.
+    """
+    history: list[tuple[datetime, Event]] = []
+    for task in _tasks.values():
+        if task.campaign_id != campaign_id:
+            continue
+        for entry in task.logs:
+            if since is None or entry.timestamp > since:
+                history.append((entry.timestamp, entry.campaign_event(task)))
+        if task.campaign_terminal_event and (since is None or task.finished_at > since):
+            history.append((task.finished_at, task.campaign_terminal_event))
+    history.sort(key=lambda item: item[0])
+
+    subscriber = Subscriber(
+        _bounded_history(
+            [event for _, event in history], settings.sse_campaign_buffer_size
+        ),
+        settings.sse_campaign_buffer_size,
+    )
+    _campaign_subscribers.setdefault(campaign_id, []).append(subscriber)
+    return subscriber
+
+
+def unsubscribe_from_campaign(campaign_id: str, subscriber: Subscriber) -> None:
+    subscribers = _campaign_subscribers.get(campaign_id, [])
+    if subscriber in subscribers:
+        subscribers.remove(subscriber)
+    if not subscribers:
+        _campaign_subscribers.pop(campaign_id, None)
+
+
+def _publish(
+    task: ExtractionTask, event: Event, campaign_event: Callable[[], Event]
+) -> None:
+    """Fan an encoded event out; the campaign variant is built only if watched."""
+    for subscriber in _task_subscribers.get(task.id, ()):
+        subscriber.put(event)
+    campaign_subscribers = _campaign_subscribers.get(task.campaign_id)
+    if campaign_subscribers:
+        tagged = campaign_event()
+        for subscriber in campaign_subscribers:
+            subscriber.put(tagged)
+
+
+def _finish(
+    task: ExtractionTask, status: TaskStatus, event_type: str, data: dict
+) -> None:
+    task.status = status
+    task.finished_at = datetime.now(UTC)
+    timestamp = task.finished_at.isoformat()
+    tagged = {**data, "task_id": task.id, "lead_id": task.lead_id}
+    tagged["timestamp"] = timestamp
+    task.terminal_event = Event(event_type, format_event(event_type, data))
+    task.campaign_terminal_event = Event(
+        event_type, format_event(event_type, tagged, timestamp), task_id=task.id
+    )
+    _publish(task, task.terminal_event, lambda: task.campaign_terminal_event)
 
 
 async def add_log(
@@ -139,29 +442,101 @@ async def add_log(
     log_type: LogType = LogType.INFO,
     progress: int | None = None,
 ) -> None:
+    """
+    Log a line for a task. PROGRESS lines are coalesced: within
+    progress_coalesce_seconds of the last one, only the latest is kept and
+    sent when the window ends. Any other line flushes it first, so order
+    is preserved and SUCCESS/ERROR lines are never held back.
+    """
     task = get_task(task_id)
     if not task:
         return
+    window = settings.progress_coalesce_seconds
+    if log_type == LogType.PROGRESS and window > 0:
+        wait = task.last_progress_at + window - time.monotonic()
+        if wait > 0:
+            if task.pending_progress is not None:
+                task.coalesced_progress += 1
+            task.pending_progress = (message, progress)
+            if task.progress_flush is None:
+                task.progress_flush = asyncio.get_running_loop().call_later(
+                    wait, _flush_due_progress, task
+                )
+            return
+        # A line held back earlier is superseded, even if its timer is due
+        _cancel_progress_flush(task)
+        if task.pending_progress is not None:
+            task.pending_progress = None
+            task.coalesced_progress += 1
+        task.last_progress_at = time.monotonic()
+    else:
+        await _flush_progress(task)
+    await _append_log(task, message, log_type, progress)
+
+
+def _cancel_progress_flush(task: ExtractionTask) -> None:
+    if task.progress_flush is not None:
+        task.progress_flush.cancel()
+        task.progress_flush = None
+
+
+def _flush_due_progress(task: ExtractionTask) -> None:
+    """Timer callback: send the held-back line once its window has passed."""
+    task.progress_flush = None
+    flush = asyncio.create_task(_flush_progress(task))
+    task.progress_flush_task = flush
+
+    def done(_: asyncio.Task) -> None:
+        if task.progress_flush_task is flush:
+            task.progress_flush_task = None
+        if not flush.cancelled() and flush.exception():
+            logger.warning(
+                f"Failed to flush progress for task {task.id}: {flush.exception()}"
+            )
+
+    flush.add_done_callback(done)
+
+
+async def _flush_progress(task: ExtractionTask) -> None:
+    """Send the held-back progress line, if any."""
+    _cancel_progress_flush(task)
+    if task.pending_progress is None:
+        return
+    message, progress = task.pending_progress
+    task.pending_progress = None
+    task.last_progress_at = time.monotonic()
+    await _append_log(task, message, LogType.PROGRESS, progress)
+
+
+async def _append_log(
+    task: ExtractionTask, message: str, log_type: LogType, progress: int | None
+) -> None:
+    full = len(task.logs) == task.logs.maxlen
+    evicted = task.logs[0] if full else None
     entry = task.add_log(message, log_type, progress)
-    await _notify_subscribers(task_id, "log", entry.to_dict())
+    if evicted and settings.task_log_spill_enabled:
+        await _spill_log(task, evicted)
+    _publish(task, entry.event(), lambda: entry.campaign_event(task))
+    if task.persist_log:
+        await task.persist_log(entry.to_dict())
 
 
 async def complete_task(task_id: str, extraction_id: str) -> None:
     task = get_task(task_id)
     if not task:
         return
-    task.status = TaskStatus.COMPLETED
+    await _flush_progress(task)
     task.extraction_id = extraction_id
-    await _notify_subscribers(task_id, "complete", {"extraction_id": extraction_id})
+    _finish(task, TaskStatus.COMPLETED, "complete", {"extraction_id": extraction_id})
 
 
 async def fail_task(task_id: str, error: str) -> None:
     task = get_task(task_id)
     if not task:
         return
-    task.status = TaskStatus.FAILED
+    await _flush_progress(task)
     task.error = error
-    await _notify_subscribers(task_id, "error", {"message": error})
+    _finish(task, TaskStatus.FAILED, "error", {"message": error})
 
 
 def set_task_running(task_id: str) -> None:
@@ -170,10 +545,41 @@ def set_task_running(task_id: str) -> None:
         task.status = TaskStatus.RUNNING
 
 
-def create_log_callback(task_id: str) -> Callable[[str, LogType, int | None], None]:
-    def callback(
-        message: str, log_type: LogType = LogType.INFO, progress: int | None = None
-    ):
-        asyncio.create_task(add_log(task_id, message, log_type, progress))
-
-    return callback
+def log_events(task_id: str, prefix: str = "") -> Callable[[Any], Awaitable[None]]:
+    """
+    Pipeline event consumer that writes each event's message, if it has
+    one, to the task's log (see search_extract.events.EventChannel).
+    """
+
+    async def consume(event: Any) -> None:
+        if event.message is not None:
+            await add_log(
+                task_id, f"{prefix}{event.message}", event.log_type, event.progress
+            )
+
+    return consume
+
+
+def get_stats() -> dict:
+    """Size of the in-memory registry: tasks, buffered logs and subscribers."""
+    evict_finished_tasks()
+    tasks = list(_tasks.values())
+    subscribers = [
+        sub
+        for channel in (_task_subscribers, _campaign_subscribers)
+        for subs in channel.values()
+        for sub in subs
+    ]
+    return {
+        "tasks": len(tasks),
+        "by_status": dict(Counter(task.status.value for task in tasks)),
+        "buffered_logs": sum(len(task.logs) for task in tasks),
+        "buffered_log_bytes": sum(
+            len(entry.message) for task in tasks for entry in task.logs
+        ),
+        "subscribers": len(subscribers),
+        "campaign_subscribers": sum(len(s) for s in _campaign_subscribers.values()),
+        "queued_events": sum(sub.qsize() for sub in subscribers),
+        "dropped_events": sum(sub.dropped for sub in subscribers),
+        "coalesced_progress": sum(task.coalesced_progress for task in tasks),
+    }
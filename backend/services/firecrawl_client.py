@@ -0,0 +1,56 @@
+import httpx
+
+from search_extract.schemas import SearchResult
+from services.rate_limit import limiter
+
+API_URL = "https://api.firecrawl.dev"
+
+
+class FirecrawlError(Exception):
+    pass
+
+
+class FirecrawlClient:
+    """
+    Async Firecrawl v2 client (search and scrape) on a caller-owned httpx pool.
+
+    The SDK's AsyncFirecrawl builds its own httpx client with keep-alive
+    disabled, so every call would pay a fresh TLS handshake. This client
+    reuses the pooled connections of the httpx.AsyncClient it is given.
+    """
+
+    def __init__(
+        self, http: httpx.AsyncClient, api_key: str, api_url: str = API_URL
+    ):
+        self._http = http
+        self._api_url = api_url
+        self._headers = {"Authorization": f"Bearer {api_key}"}
+
+    async def _post(self, endpoint: str, payload: dict) -> dict:
+        async def request() -> dict:
+            response = await self._http.post(
+                f"{self._api_url}{endpoint}", json=payload, headers=self._headers
+            )
+            response.raise_for_status()
+            return response.json()
+
+        body = await limiter.call("firecrawl", endpoint.rsplit("/", 1)[-1], request)
+        if not body.get("success"):
+            raise FirecrawlError(body.get("error") or f"{endpoint} failed")
+        return body.get("data") or {}
+
+    async def search(self, query: str, limit: int = 10) -> list[SearchResult]:
+        data = await self._post("/v2/search", {"query": query, "limit": limit})
+        return [
+            SearchResult(
+                url=item["url"],
+                title=item.get("title"),
+                description=item.get("description"),
+            )
+            for item in data.get("web") or []
+        ]
+
+    async def scrape(self, url: str) -> str:
+        """Scrape a page and return its markdown."""
+        data = await self._post("/v2/scrape", {"url": url, "formats": ["markdown"]})
+        return data.get("markdown") or ""
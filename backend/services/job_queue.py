@@ -0,0 +1,452 @@
+import logging
+from collections import deque
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+from config import settings
+from database import ensure_ttl_index
+from services.extraction_task import TaskStatus
+
+logger = logging.getLogger(__name__)
+
+COLLECTION = "extraction_jobs"
+
+# Interactive jobs (identity extractions, single lead runs) are claimed
+# before any bulk job; bulk jobs are shared fairly between campaigns
+INTERACTIVE = "interactive"
+BULK = "bulk"
+LANES = (INTERACTIVE, BULK)
+
+# Seconds recently claimed jobs waited in the queue, per lane (this process)
+_waits: dict[str, deque[float]] = {lane: deque(maxlen=1000) for lane in LANES}
+
+
+def _lease_expiry() -> datetime:
+    return datetime.now(UTC) + timedelta(
+        seconds=settings.job_visibility_timeout_seconds
+    )
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase) -> None:
+    """Indexes for claiming jobs, plus a TTL that expires finished jobs."""
+    await db[COLLECTION].create_index([("status", 1), ("available_at", 1)])
+    await db[COLLECTION].create_index([("status", 1), ("lease_expires_at", 1)])
+    await db[COLLECTION].create_index([("payload.campaign_id", 1), ("status", 1)])
+    await db[COLLECTION].create_index([("lane", 1), ("status", 1), ("created_at", 1)])
+    await ensure_ttl_index(db, COLLECTION, "finished_at", settings.job_ttl_seconds)
+
+
+def _job_doc(
+    job_id: str,
+    kind: str,
+    payload: dict,
+    group: str | None,
+    max_running: int | None,
+    lane: str,
+    now: datetime,
+) -> dict:
+    return {
+        "_id": job_id,
+        "kind": kind,
+        "payload": payload,
+        "lane": lane,
+        "status": TaskStatus.PENDING.value,
+        "attempts": 0,
+        "max_attempts": settings.job_max_attempts,
+        "group": group,
+        "max_running": max_running,
+        "available_at": now,
+        "created_at": now,
+        "logs": [],
+        "log_count": 0,
+    }
+
+
+async def enqueue(
+    db: AsyncIOMotorDatabase,
+    job_id: str,
+    kind: str,
+    payload: dict,
+    group: str | None = None,
+    max_running: int | None = None,
+    lane: str = BULK,
+) -> None:
+    """
+    Add a pending job; job_id doubles as the extraction task ID. Jobs that
+    share a group run at most max_running at a time across all workers.
+    """
+    await db[COLLECTION].insert_one(
+        _job_doc(job_id, kind, payload, group, max_running, lane, datetime.now(UTC))
+    )
+
+
+async def enqueue_many(
+    db: AsyncIOMotorDatabase,
+    jobs: list[tuple[str, str, dict]],
+    group: str | None = None,
+    max_running: int | None = None,
+    lane: str = BULK,
+) -> None:
+    """Add (job_id, kind, payload) jobs in one insert; see enqueue."""
+    if not jobs:
+        return
+    now = datetime.now(UTC)
+    await db[COLLECTION].insert_many(
+        [
+            _job_doc(job_id, kind, payload, group, max_running, lane, now)
+            for job_id, kind, payload in jobs
+        ]
+    )
+
+
+async def _full_groups(db: AsyncIOMotorDatabase, now: datetime) -> list[str]:
+    """Groups already running as many live jobs as they allow."""
+    cursor = db[COLLECTION].aggregate(
+        [
+            {
+                "$match": {
+                    "status": TaskStatus.RUNNING.value,
+                    "lease_expires_at": {"$gte": now},
+                    "group": {"$ne": None},
+                }
+            },
+            {
+                "$group": {
+                    "_id": "$group",
+                    "running": {"$sum": 1},
+                    "limit": {"$first": "$max_running"},
+                }
+            },
+        ]
+    )
+    return [
+        row["_id"]
+        async for row in cursor
+        if row["limit"] is not None and row["running"] >= row["limit"]
+    ]
+
+
+async def claim(
+    db: AsyncIOMotorDatabase, worker_id: str, include_bulk: bool = True
+) -> dict | None:
+    """
+    Lease the next runnable job: a pending job whose retry delay has
+    passed, or a running job whose lease expired (its worker died).
+
+    The oldest interactive job goes first. Otherwise a bulk job is taken
+    from the campaign using the smallest share of running bulk jobs,
+    relative to its weight (campaign_weights, default 1), so one large
+    campaign cannot starve the others. Jobs in a group at its max_running
+    are skipped; that cap is soft, since two workers may claim from the
+    same group at once.
+    """
+    now = datetime.now(UTC)
+    runnable: dict = {
+        "$or": [
+            {"status": TaskStatus.PENDING.value, "available_at": {"$lte": now}},
+            {"status": TaskStatus.RUNNING.value, "lease_expires_at": {"$lt": now}},
+        ]
+    }
+    full = await _full_groups(db, now)
+    if full:
+        runnable["group"] = {"$nin": full}
+
+    job = await _claim_one(db, worker_id, {**runnable, "lane": INTERACTIVE}, now)
+    if job or not include_bulk:
+        return job
+
+    bulk = {**runnable, "lane": {"$ne": INTERACTIVE}}
+    for campaign_id in await _fair_campaign_order(db, bulk, now):
+        job = await _claim_one(
+            db, worker_id, {**bulk, "payload.campaign_id": campaign_id}, now
+        )
+        if job:
+            return job
+    return None
+
+
+async def _fair_campaign_order(
+    db: AsyncIOMotorDatabase, bulk: dict, now: datetime
+) -> list[str]:
+    """Campaigns with runnable bulk jobs, least served (by weight) first."""
+    oldest = {
+        row["_id"]: row["oldest"]
+        async for row in db[COLLECTION].aggregate(
+            [
+                {"$match": bulk},
+                {
+                    "$group": {
+                        "_id": "$payload.campaign_id",
+                        "oldest": {"$min": "$created_at"},
+                    }
+                },
+            ]
+        )
+    }
+    if len(oldest) < 2:
+        return list(oldest)
+
+    running = {
+        row["_id"]: row["running"]
+        async for row in db[COLLECTION].aggregate(
+            [
+                {
+                    "$match": {
+                        "status": TaskStatus.RUNNING.value,
+                        "lease_expires_at": {"$gte": now},
+                        "lane": {"$ne": INTERACTIVE},
+                    }
+                },
+                {"$group": {"_id": "$payload.campaign_id", "running": {"$sum": 1}}},
+            ]
+        )
+    }
+
+    def share(campaign_id: str) -> tuple[float, datetime]:
+        weight = settings.campaign_weights.get(campaign_id, 1.0)
+        return running.get(campaign_id, 0) / weight, oldest[campaign_id]
+
+    return sorted(oldest, key=share)
+
+
+async def _claim_one(
+    db: AsyncIOMotorDatabase, worker_id: str, query: dict, now: datetime
+) -> dict | None:
+    job = await db[COLLECTION].find_one_and_update(
+        query,
+        {
+            "$set": {
+                "status": TaskStatus.RUNNING.value,
+                "lease_owner": worker_id,
+                "lease_expires_at": _lease_expiry(),
+                "started_at": now,
+                "logs": [],
+                "log_count": 0,
+            },
+            "$inc": {"attempts": 1},
+        },
+        sort=[("created_at", 1)],
+        return_document=ReturnDocument.AFTER,
+    )
+    if job:
+        available_at = job["available_at"]
+        if available_at.tzinfo is None:
+            available_at = available_at.replace(tzinfo=UTC)
+        lane = job.get("lane", BULK)
+        _waits[lane if lane in _waits else BULK].append(
+            max(0.0, (now - available_at).total_seconds())
+        )
+    return job
+
+
+async def heartbeat(db: AsyncIOMotorDatabase, job_id: str, worker_id: str) -> bool:
+    """Extend a job's lease. Returns False if the worker no longer holds it."""
+    result = await db[COLLECTION].update_one(
+        {
+            "_id": job_id,
+            "lease_owner": worker_id,
+            "status": TaskStatus.RUNNING.value,
+        },
+        {"$set": {"lease_expires_at": _lease_expiry()}},
+    )
+    return result.matched_count > 0
+
+
+async def complete(
+    db: AsyncIOMotorDatabase, job_id: str, worker_id: str, extraction_id: str | None
+) -> None:
+    await _finish(
+        db,
+        job_id,
+        worker_id,
+        {"status": TaskStatus.COMPLETED.value, "extraction_id": extraction_id},
+    )
+
+
+async def fail(
+    db: AsyncIOMotorDatabase, job_id: str, worker_id: str, error: str
+) -> None:
+    await _finish(
+        db, job_id, worker_id, {"status": TaskStatus.FAILED.value, "error": error}
+    )
+
+
+async def retry(
+    db: AsyncIOMotorDatabase, job_id: str, worker_id: str, delay_seconds: float
+) -> None:
+    """Put a leased job back in the queue, runnable after delay_seconds."""
+    await db[COLLECTION].update_one(
+        {"_id": job_id, "lease_owner": worker_id},
+        {
+            "$set": {
+                "status": TaskStatus.PENDING.value,
+                "available_at": datetime.now(UTC) + timedelta(seconds=delay_seconds),
+            },
+            "$unset": {"lease_owner": "", "lease_expires_at": ""},
+        },
+    )
+
+
+async def release(db: AsyncIOMotorDatabase, job_id: str, worker_id: str) -> None:
+    """Hand a job back untouched (worker shutdown); the attempt is not counted."""
+    await db[COLLECTION].update_one(
+        {"_id": job_id, "lease_owner": worker_id},
+        {
+            "$set": {
+                "status": TaskStatus.PENDING.value,
+                "available_at": datetime.now(UTC),
+            },
+            "$unset": {"lease_owner": "", "lease_expires_at": ""},
+            "$inc": {"attempts": -1},
+        },
+    )
+
+
+async def _finish(
+    db: AsyncIOMotorDatabase, job_id: str, worker_id: str, fields: dict
+) -> None:
+    await db[COLLECTION].update_one(
+        {"_id": job_id, "lease_owner": worker_id},
+        {
+            "$set": {**fields, "finished_at": datetime.now(UTC)},
+            "$unset": {"lease_expires_at": ""},
+        },
+    )
+
+
+async def append_log(db: AsyncIOMotorDatabase, job_id: str, entry: dict) -> None:
+    """Persist a log entry so any API process can stream the job's progress."""
+    try:
+        await db[COLLECTION].update_one(
+            {"_id": job_id},
+            {
+                "$push": {
+                    "logs": {"$each": [entry], "$slice": -settings.job_log_limit}
+                },
+                "$inc": {"log_count": 1},
+            },
+        )
+    except Exception as e:
+        logger.warning(f"Failed to persist log for job {job_id}: {e}")
+
+
+async def get_job(db: AsyncIOMotorDatabase, job_id: str) -> dict | None:
+    return await db[COLLECTION].find_one({"_id": job_id})
+
+
+async def campaign_jobs(
+    db: AsyncIOMotorDatabase,
+    campaign_id: str,
+    finished_after: datetime,
+    seen: dict[str, tuple[int, int]],
+    exclude: Iterable[str] = (),
+) -> list[dict]:
+    """
+    A campaign's running jobs and those finished after `finished_after`, in
+    one query. `seen` maps job ID -> (attempt, last log entry ID) already
+    read; each job carries only the log entries after that, or all of them
+    for a job not seen yet or whose logs restarted.
+    """
+    job_ids = list(seen)
+    index = {"$indexOfArray": [job_ids, "$_id"]}
+    # A missing job ID gives index -1, which picks the trailing default
+    attempts = [seen[job_id][0] for job_id in job_ids] + [None]
+    last_ids = [seen[job_id][1] for job_id in job_ids] + [0]
+    last_id = {"$arrayElemAt": [last_ids, index]}
+    # Logs restart on a new attempt, or on a run released at shutdown
+    same_run = {
+        "$and": [
+            {"$eq": ["$attempts", {"$arrayElemAt": [attempts, index]}]},
+            {"$gte": ["$log_count", last_id]},
+        ]
+    }
+    after = {"$cond": [same_run, last_id, 0]}
+    cursor = db[COLLECTION].aggregate(
+        [
+            {
+                "$match": {
+                    "payload.campaign_id": campaign_id,
+                    "_id": {"$nin": list(exclude)},
+                    "$or": [
+                        {"status": TaskStatus.RUNNING.value},
+                        {"finished_at": {"$gt": finished_after}},
+                    ],
+                }
+            },
+            {
+                "$addFields": {
+                    "logs": {
+                        "$filter": {
+                            "input": "$logs",
+                            "cond": {"$gt": ["$$this.id", after]},
+                        }
+                    }
+                }
+            },
+        ]
+    )
+    return [job async for job in cursor]
+
+
+def _percentile(values: list[float], fraction: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[int(fraction * (len(ordered) - 1))], 2)
+
+
+async def _lane_stats(db: AsyncIOMotorDatabase) -> dict:
+    """Queued and running jobs per lane, and how long recent claims waited."""
+    counts = {lane: {"queued": 0, "running": 0} for lane in LANES}
+    async for row in db[COLLECTION].aggregate(
+        [
+            {
+                "$match": {
+                    "status": {
+                        "$in": [TaskStatus.PENDING.value, TaskStatus.RUNNING.value]
+                    }
+                }
+            },
+            {
+                "$group": {
+                    "_id": {"lane": "$lane", "status": "$status"},
+                    "count": {"$sum": 1},
+                }
+            },
+        ]
+    ):
+        lane = row["_id"].get("lane")
+        lane = lane if lane in counts else BULK
+        key = (
+            "queued" if row["_id"]["status"] == TaskStatus.PENDING.value else "running"
+        )
+        counts[lane][key] += row["count"]
+
+    for lane, waits in _waits.items():
+        recent = list(waits)
+        counts[lane]["wait_p50_seconds"] = _percentile(recent, 0.5)
+        counts[lane]["wait_p95_seconds"] = _percentile(recent, 0.95)
+    return counts
+
+
+async def get_stats(db: AsyncIOMotorDatabase) -> dict:
+    """
+    Job counts by status, how many running jobs have an expired lease, and
+    per-lane queue depth and wait times.
+    """
+    counts = {status.value: 0 for status in TaskStatus}
+    async for row in db[COLLECTION].aggregate(
+        [{"$group": {"_id": "$status", "count": {"$sum": 1}}}]
+    ):
+        counts[row["_id"]] = row["count"]
+    counts["expired_leases"] = await db[COLLECTION].count_documents(
+        {
+            "status": TaskStatus.RUNNING.value,
+            "lease_expires_at": {"$lt": datetime.now(UTC)},
+        }
+    )
+    counts["lanes"] = await _lane_stats(db)
+    return counts
@@ -0,0 +1,134 @@
+import hashlib
+import json
+import logging
+from collections import OrderedDict, defaultdict
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from functools import cache
+from typing import TypeVar
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pydantic import BaseModel
+
+import database
+from config import settings
+from database import ensure_ttl_index
+from services.cache_stats import CacheStats
+
+logger = logging.getLogger(__name__)
+
+COLLECTION = "llm_cache"
+
+T = TypeVar("T", bound=BaseModel)
+
+# In-process tier: cache key -> parsed response as a dict
+_lru: OrderedDict[str, dict] = OrderedDict()
+
+# Per-call-site counters
+stats: defaultdict[str, CacheStats] = defaultdict(CacheStats)
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase) -> None:
+    """Create the TTL index that expires cached LLM responses."""
+    await ensure_ttl_index(db, COLLECTION, "created_at", settings.llm_cache_ttl_seconds)
+
+
+@cache
+def _schema_fingerprint(schema: type[BaseModel]) -> str:
+    return json.dumps(schema.model_json_schema(), sort_keys=True)
+
+
+def cache_key(
+    model: str, prompt_version: str, schema: type[BaseModel], content: str
+) -> str:
+    """Hash of everything that determines a structured-output response."""
+    digest = hashlib.sha256()
+    for part in (model, prompt_version, _schema_fingerprint(schema), content):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _remember(key: str, response: dict) -> None:
+    _lru[key] = response
+    _lru.move_to_end(key)
+    while len(_lru) > settings.llm_cache_max_entries:
+        _lru.popitem(last=False)
+
+
+async def cached_parse(
+    call_site: str,
+    model: str,
+    prompt_version: str,
+    schema: type[T],
+    content: str,
+    compute: Callable[[], Awaitable[T | None]],
+) -> T | None:
+    """
+    Return the parsed response for identical input from cache, or run compute.
+
+    content must contain every input sent to the model (prompt and payload).
+    Lookups go to the in-process LRU first, then Mongo; only non-empty
+    responses are cached, and exceptions from compute propagate uncached.
+    """
+    if not settings.llm_cache_enabled:
+        return await compute()
+
+    site_stats = stats[call_site]
+    key = cache_key(model, prompt_version, schema, content)
+
+    if key in _lru:
+        _lru.move_to_end(key)
+        site_stats.hits += 1
+        return schema.model_validate(_lru[key])
+
+    collection = None
+    if database.db_client is not None:
+        collection = database.get_database()[COLLECTION]
+        try:
+            doc = await collection.find_one({"_id": key})
+        except Exception as e:
+            site_stats.errors += 1
+            logger.warning(f"LLM cache lookup failed for {call_site}: {e}")
+            doc = None
+        if doc:
+            site_stats.hits += 1
+            _remember(key, doc["response"])
+            return schema.model_validate(doc["response"])
+
+    site_stats.misses += 1
+    result = await compute()
+    if result is None:
+        return None
+
+    response = result.model_dump(mode="json")
+    _remember(key, response)
+    site_stats.stores += 1
+    if collection is not None:
+        try:
+            await collection.update_one(
+                {"_id": key},
+                {
+                    "$set": {
+                        "call_site": call_site,
+                        "model": model,
+                        "prompt_version": prompt_version,
+                        "response": response,
+                        "created_at": datetime.now(UTC),
+                    }
+                },
+                upsert=True,
+            )
+        except Exception as e:
+            site_stats.errors += 1
+            logger.warning(f"LLM cache store failed for {call_site}: {e}")
+    return result
+
+
+def get_stats() -> dict:
+    return {
+        "entries_in_memory": len(_lru),
+        "call_sites": {
+            site: site_stats.to_dict() for site, site_stats in stats.items()
+        },
+    }
@@ -0,0 +1,204 @@
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import httpx
+import openai
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# Seconds of traffic a bucket may burst before it starts metering
+BURST_SECONDS = 10
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Rough prompt size (about 4 characters per token) plus room for output."""
+    return sum(len(text) for text in texts) // 4 + 1000
+
+
+class TokenBucket:
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60
+        self.capacity = max(1.0, self.rate * BURST_SECONDS)
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float, factor: float) -> None:
+        elapsed = now - self.updated
+        self.level = min(self.capacity, self.level + elapsed * self.rate * factor)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float, factor: float) -> float:
+        self._refill(now, factor)
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / (self.rate * factor)
+
+    def take(self, amount: float) -> None:
+        self.level -= min(amount, self.capacity)
+
+
+class ProviderLimiter:
+    """
+    Requests/min and tokens/min budget for one provider and model.
+
+    Callers queue in FIFO order. A 429 halves the effective rate and pauses
+    the whole queue for the backoff delay; successes slowly restore it.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int | None):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.rate_factor = 1.0
+        self.paused_until = 0.0
+        self.waiting = 0
+        self.in_flight = 0
+        self.throttled = 0
+        self.retries = 0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int) -> None:
+        self.waiting += 1
+        try:
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    wait = max(
+                        self.paused_until - now,
+                        self.requests.wait_time(1, now, self.rate_factor),
+                        self.tokens.wait_time(tokens, now, self.rate_factor)
+                        if self.tokens
+                        else 0.0,
+                    )
+                    if wait <= 0:
+                        break
+                    await asyncio.sleep(wait)
+                self.requests.take(1)
+                if self.tokens:
+                    self.tokens.take(tokens)
+        finally:
+            self.waiting -= 1
+
+    def on_success(self) -> None:
+        self.rate_factor = min(1.0, self.rate_factor + 0.05)
+
+    def on_throttled(self, delay: float) -> None:
+        self.throttled += 1
+        self.rate_factor = max(0.1, self.rate_factor / 2)
+        self.paused_until = max(self.paused_until, time.monotonic() + delay)
+
+    def to_dict(self) -> dict:
+        return {
+            "queue_depth": self.waiting,
+            "in_flight": self.in_flight,
+            "rate_factor": round(self.rate_factor, 2),
+            "throttled": self.throttled,
+            "retries": self.retries,
+        }
+
+
+def _status_code(error: Exception) -> int | None:
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code
+    return None
+
+
+def _retry_after(error: Exception) -> float | None:
+    response = getattr(error, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, (openai.APIConnectionError, httpx.TransportError)):
+        return True
+    return _status_code(error) in RETRYABLE_STATUS
+
+
+class RateLimiter:
+    """Process-wide limiter shared by every OpenAI and Firecrawl call site."""
+
+    def __init__(self):
+        self._limiters: dict[str, ProviderLimiter] = {}
+
+    def _limiter(self, provider: str, model: str) -> ProviderLimiter:
+        key = f"{provider}:{model}"
+        if key not in self._limiters:
+            limits = {
+                "openai": {
+                    "requests_per_minute": settings.openai_requests_per_minute,
+                    "tokens_per_minute": settings.openai_tokens_per_minute,
+                },
+                "firecrawl": {
+                    "requests_per_minute": settings.firecrawl_requests_per_minute,
+                },
+            }.get(provider, {"requests_per_minute": 60})
+            limits |= settings.rate_limit_overrides.get(key, {})
+            self._limiters[key] = ProviderLimiter(
+                limits["requests_per_minute"], limits.get("tokens_per_minute")
+            )
+        return self._limiters[key]
+
+    async def call(
+        self,
+        provider: str,
+        model: str,
+        fn: Callable[[], Awaitable[T]],
+        tokens: int = 0,
+    ) -> T:
+        """
+        Run fn once the provider budget allows it, retrying 429/5xx and
+        connection errors with exponential backoff and full jitter.
+        """
+        limiter = self._limiter(provider, model)
+        attempt = 0
+        while True:
+            await limiter.acquire(tokens)
+            limiter.in_flight += 1
+            try:
+                result = await fn()
+            except Exception as e:
+                error = e
+            else:
+                limiter.on_success()
+                return result
+            finally:
+                limiter.in_flight -= 1
+
+            if not _is_retryable(error) or attempt >= settings.rate_limit_max_retries:
+                raise error
+            ceiling = min(
+                settings.rate_limit_max_backoff_seconds,
+                settings.rate_limit_base_backoff_seconds * 2**attempt,
+            )
+            delay = max(random.uniform(0, ceiling), _retry_after(error) or 0.0)
+            if _status_code(error) == 429:
+                limiter.on_throttled(delay)
+            limiter.retries += 1
+            attempt += 1
+            logger.warning(
+                f"{provider}:{model} call failed ({error}), "
+                f"retry {attempt} in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+    def get_stats(self) -> dict:
+        return {key: limiter.to_dict() for key, limiter in self._limiters.items()}
+
+
+limiter = RateLimiter()
@@ -2,9 +2,8 @@ import logging
 import tempfile
 from pathlib import Path
 
-from reducto import Reducto
+from reducto import AsyncReducto
 
-from config import settings
 from schemas.profile import Education, Experience, FounderProfile, SocialUrls
 
 logger = logging.getLogger(__name__)
@@ -95,22 +94,22 @@ def parse_year(date_str: str | None) -> int | None:
         return None
 
 
-async def extract_profile_from_pdf(file_content: bytes) -> FounderProfile:
+async def extract_profile_from_pdf(
+    client: AsyncReducto, file_content: bytes
+) -> FounderProfile:
     """Extract founder profile from PDF using Reducto extract API."""
     logger.info("Starting PDF extraction...")
 
-    client = Reducto(api_key=settings.reducto_api_key)
-
     with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
         tmp.write(file_content)
         tmp_path = Path(tmp.name)
 
     try:
         logger.info("Uploading to Reducto...")
-        upload = client.upload(file=tmp_path)
+        upload = await client.upload(file=tmp_path)
 
         logger.info("Running extract...")
-        result = client.extract.run(
+        result = await client.extract.run(
             input=upload,
             instructions={"schema": EXTRACT_SCHEMA},
             settings={"citations": {"enabled": True}},
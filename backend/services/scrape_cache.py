@@ -0,0 +1,72 @@
+import hashlib
+import logging
+import zlib
+from datetime import UTC, datetime, timedelta
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from config import settings
+from database import ensure_ttl_index
+from search_extract.urls import canonicalize_url
+from services.cache_stats import CacheStats
+
+logger = logging.getLogger(__name__)
+
+COLLECTION = "scrape_cache"
+
+stats = CacheStats()
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase) -> None:
+    """Create the TTL index that expires cached pages."""
+    await ensure_ttl_index(
+        db, COLLECTION, "fetched_at", settings.scrape_cache_ttl_seconds
+    )
+
+
+async def get_cached_page(
+    db: AsyncIOMotorDatabase, url: str, max_age_seconds: int | None = None
+) -> str | None:
+    """Return cached markdown for a URL if it is within the freshness window."""
+    if max_age_seconds is None:
+        max_age_seconds = settings.scrape_cache_max_age_seconds
+    fresh_after = datetime.now(UTC) - timedelta(seconds=max_age_seconds)
+
+    try:
+        doc = await db[COLLECTION].find_one(
+            {"_id": canonicalize_url(url), "fetched_at": {"$gte": fresh_after}}
+        )
+    except Exception as e:
+        stats.errors += 1
+        logger.warning(f"Scrape cache lookup failed for {url}: {e}")
+        return None
+
+    if not doc:
+        stats.misses += 1
+        return None
+
+    stats.hits += 1
+    return zlib.decompress(doc["markdown"]).decode()
+
+
+async def store_page(db: AsyncIOMotorDatabase, url: str, markdown: str) -> None:
+    """Cache scraped markdown (compressed) together with its content hash."""
+    data = markdown.encode()
+    try:
+        await db[COLLECTION].update_one(
+            {"_id": canonicalize_url(url)},
+            {
+                "$set": {
+                    "url": url,
+                    "markdown": zlib.compress(data),
+                    "content_hash": hashlib.sha256(data).hexdigest(),
+                    "size": len(data),
+                    "fetched_at": datetime.now(UTC),
+                }
+            },
+            upsert=True,
+        )
+        stats.stores += 1
+    except Exception as e:
+        stats.errors += 1
+        logger.warning(f"Scrape cache store failed for {url}: {e}")
@@ -0,0 +1,90 @@
+import logging
+import re
+from datetime import UTC, datetime, timedelta
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from config import settings
+from database import ensure_ttl_index
+from search_extract.schemas import SearchResult
+from services.cache_stats import CacheStats
+
+logger = logging.getLogger(__name__)
+
+COLLECTION = "search_cache"
+
+stats = CacheStats()
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    return " ".join(re.sub(r"[^\w\s]", " ", query.lower()).split())
+
+
+def _cache_key(query: str, limit: int) -> str:
+    return f"{limit}:{normalize_query(query)}"
+
+
+def format_age(seconds: float) -> str:
+    if seconds < 60:
+        return f"{int(seconds)}s"
+    if seconds < 3600:
+        return f"{int(seconds // 60)}m"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)}h"
+    return f"{int(seconds // 86400)}d"
+
+
+async def ensure_indexes(db: AsyncIOMotorDatabase) -> None:
+    """Create the TTL index that expires cached searches."""
+    await ensure_ttl_index(
+        db, COLLECTION, "created_at", settings.search_cache_ttl_seconds
+    )
+
+
+async def get_cached_search(
+    db: AsyncIOMotorDatabase, query: str, limit: int
+) -> tuple[list[SearchResult], float] | None:
+    """Return cached results for a query and their age in seconds."""
+    now = datetime.now(UTC)
+    fresh_after = now - timedelta(seconds=settings.search_cache_ttl_seconds)
+
+    try:
+        doc = await db[COLLECTION].find_one(
+            {"_id": _cache_key(query, limit), "created_at": {"$gte": fresh_after}}
+        )
+    except Exception as e:
+        stats.errors += 1
+        logger.warning(f"Search cache lookup failed for {query!r}: {e}")
+        return None
+
+    if not doc:
+        stats.misses += 1
+        return None
+
+    stats.hits += 1
+    created_at = doc["created_at"].replace(tzinfo=UTC)
+    results = [SearchResult(**item) for item in doc["results"]]
+    return results, (now - created_at).total_seconds()
+
+
+async def store_search(
+    db: AsyncIOMotorDatabase, query: str, limit: int, results: list[SearchResult]
+) -> None:
+    try:
+        await db[COLLECTION].update_one(
+            {"_id": _cache_key(query, limit)},
+            {
+                "$set": {
+                    "query": query,
+                    "limit": limit,
+                    "results": [result.model_dump() for result in results],
+                    "created_at": datetime.now(UTC),
+                }
+            },
+            upsert=True,
+        )
+        stats.stores += 1
+    except Exception as e:
+        stats.errors += 1
+        logger.warning(f"Search cache store failed for {query!r}: {e}")
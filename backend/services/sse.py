@@ -0,0 +1,42 @@
+import json
+from dataclasses import dataclass
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+# Seconds of silence before a stream sends a ping
+KEEPALIVE_SECONDS = 30.0
+
+PING = b"event: ping\ndata: {}\n\n"
+
+TERMINAL_EVENTS = ("complete", "error")
+
+
+def format_event(
+    event_type: str, data: dict, event_id: str | int | None = None
+) -> bytes:
+    """One SSE frame; the ID lets a reconnecting client resume after it."""
+    prefix = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{prefix}event: {event_type}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    """
+    An event encoded once when published; the same frame is written to
+    every subscriber and reused when replaying history.
+    """
+
+    type: str
+    frame: bytes
+    # Set on campaign streams, where one buffer holds many tasks' events
+    task_id: str | None = None
+    # Progress lines a lagging subscriber may coalesce away
+    progress: bool = False
+
+    @property
+    def terminal(self) -> bool:
+        return self.type in TERMINAL_EVENTS
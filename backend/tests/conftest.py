@@ -0,0 +1,4 @@
+import os
+
+# Settings require a Mongo URI at import; unit tests never connect
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017")
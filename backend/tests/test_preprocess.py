@@ -0,0 +1,65 @@
+from search_extract.preprocess import GAP, clean_markdown, prepare
+
+BIO = """# Jane Doe
+
+Product designer focused on design in healthcare and accessible tools.
+
+I write a blog in my spare time about typography and cycling.
+
+Catalog in hand, she spends weekends restoring vintage synthesizers.
+
+Subscribers to her newsletter get a monthly reading list."""
+
+
+def test_clean_markdown_keeps_bio_lines_with_boilerplate_substrings():
+    assert clean_markdown(BIO) == BIO
+
+
+def test_clean_markdown_drops_boilerplate_blocks():
+    page = f"""Skip to main content
+
+[Home](/) [About](/about) [Blog](/blog) [Contact](/contact)
+
+{BIO}
+
+We use cookies to improve your experience. Accept all
+
+Sign in
+Log in with Google
+
+© 2024 Jane Doe. All rights reserved."""
+    assert clean_markdown(page) == BIO
+
+
+def test_clean_markdown_keeps_long_blocks_and_drops_repeats():
+    long_block = "Sign in to read more. " + "Jane Doe builds design systems. " * 10
+    page = f"{long_block}\n\n![photo](/jane.png)\n\n{BIO}\n\n# Jane Doe"
+    assert clean_markdown(page) == f"{long_block.strip()}\n\n{BIO}"
+
+
+def test_clean_markdown_collapses_links_to_their_text():
+    page = "Jane speaks at [PyCon](https://pycon.org) every year."
+    assert clean_markdown(page) == "Jane speaks at PyCon every year."
+
+
+def test_prepare_returns_short_pages_whole():
+    prepared = prepare(BIO, ["Jane", "Doe"], 10_000)
+    assert prepared.text == BIO
+    assert prepared.chars_before == prepared.chars_after == len(BIO)
+
+
+def test_prepare_keeps_blocks_mentioning_terms_and_their_neighbours():
+    filler = [
+        f"Unrelated paragraph number {i} about the conference venue." for i in range(20)
+    ]
+    blocks = [*filler[:10], "She lives in Berlin with her two cats.", *filler[10:]]
+    page = "\n\n".join(blocks)
+    prepared = prepare(page, ["Berlin"], 300)
+
+    assert len(prepared.text) <= 300
+    assert "She lives in Berlin with her two cats." in prepared.text
+    assert filler[9] in prepared.text and filler[10] in prepared.text
+    assert prepared.text.startswith(filler[0])
+    assert GAP in prepared.text
+    assert prepared.chars_before == len(page)
+    assert prepared.chars_after == len(prepared.text)
@@ -0,0 +1,233 @@
+"""
+Extraction worker: claims queued jobs from Mongo and runs them.
+
+Runs inside the API process (see EMBEDDED_WORKER_ENABLED) or standalone,
+so separate processes can drain the queue:
+
+    uv run python worker.py
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import signal
+import socket
+import uuid
+from functools import partial
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+from config import settings
+from database import get_database, set_client
+from routers.identity import run_extraction_background
+from routers.leads import run_lead_extraction_background
+from schemas.leads import LeadStatus
+from services import campaign as campaign_service
+from services import job_queue
+from services.clients import Clients, set_clients
+from services.extraction_task import (
+    TaskStatus,
+    fail_task,
+    register_task,
+    unregister_task,
+)
+
+logger = logging.getLogger(__name__)
+
+# Job kind -> coroutine called with the task ID and the job payload
+JOB_HANDLERS = {
+    "identity": run_extraction_background,
+    "lead": run_lead_extraction_background,
+}
+
+
+class Worker:
+    """
+    Claims up to `concurrency` jobs at a time and runs them. A heartbeat
+    renews each job's lease; if a worker dies, the lease expires and
+    another worker picks the job up again until max attempts is reached.
+    Bulk jobs never fill the last `worker_interactive_slots` slots, so an
+    interactive job can start without waiting for a bulk one to finish.
+    """
+
+    def __init__(self, concurrency: int | None = None):
+        self.id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self._concurrency = max(1, concurrency or settings.worker_concurrency)
+        self._bulk_slots = max(1, self._concurrency - settings.worker_interactive_slots)
+        self._bulk_running = 0
+        self._running: dict[str, asyncio.Task] = {}
+        self._stopping = asyncio.Event()
+        self._loop_task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._loop_task = asyncio.create_task(self._claim_loop())
+        logger.info(f"Worker {self.id} started ({self._concurrency} slots)")
+
+    async def stop(self) -> None:
+        """Stop claiming and hand in-flight jobs back to the queue."""
+        self._stopping.set()
+        if self._loop_task:
+            self._loop_task.cancel()
+        for task in list(self._running.values()):
+            task.cancel()
+        await asyncio.gather(
+            *(task for task in (self._loop_task, *self._running.values()) if task),
+            return_exceptions=True,
+        )
+
+    async def _claim_loop(self) -> None:
+        db = get_database()
+        slots = asyncio.Semaphore(self._concurrency)
+        while not self._stopping.is_set():
+            await slots.acquire()
+            try:
+                job = await job_queue.claim(
+                    db, self.id, include_bulk=self._bulk_running < self._bulk_slots
+                )
+            except Exception as e:
+                logger.warning(f"Worker {self.id} failed to claim a job: {e}")
+                job = None
+
+            if job is None:
+                slots.release()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._stopping.wait(), settings.job_poll_interval_seconds
+                    )
+                continue
+
+            job_id = job["_id"]
+            bulk = job.get("lane") != job_queue.INTERACTIVE
+            self._bulk_running += bulk
+            task = asyncio.create_task(self._run_job(db, job))
+            self._running[job_id] = task
+
+            def done(_: asyncio.Task, job_id: str = job_id, bulk: bool = bulk) -> None:
+                self._running.pop(job_id, None)
+                self._bulk_running -= bulk
+                slots.release()
+
+            task.add_done_callback(done)
+
+    async def _run_job(self, db: AsyncIOMotorDatabase, job: dict) -> None:
+        job_id = job["_id"]
+        payload = job["payload"]
+        if job["attempts"] > job["max_attempts"]:
+            await self._give_up(
+                db, job, f"Gave up after {job['max_attempts']} attempts"
+            )
+            return
+
+        handler = JOB_HANDLERS.get(job["kind"])
+        if handler is None:
+            await job_queue.fail(
+                db, job_id, self.id, f"Unknown job kind: {job['kind']}"
+            )
+            return
+
+        task = register_task(
+            job_id,
+            payload["campaign_id"],
+            payload["query"],
+            lead_id=payload.get("lead_id"),
+            lead_index=payload.get("lead_index"),
+            persist_log=partial(job_queue.append_log, db, job_id),
+        )
+        logger.info(f"Worker {self.id} running {job['kind']} job {job_id}")
+
+        work = asyncio.create_task(handler(job_id, **payload))
+        lease_lost = asyncio.Event()
+        heartbeat = asyncio.create_task(self._heartbeat(db, job_id, work, lease_lost))
+        try:
+            await work
+        except asyncio.CancelledError:
+            unregister_task(job_id)
+            if lease_lost.is_set():
+                logger.warning(f"Worker {self.id} lost the lease on job {job_id}")
+                return
+            # Shutting down: make the job claimable again right away
+            await job_queue.release(db, job_id, self.id)
+            raise
+        except Exception as e:
+            logger.exception(f"Job {job_id} crashed")
+            if job["attempts"] < job["max_attempts"]:
+                unregister_task(job_id)
+                await job_queue.retry(
+                    db, job_id, self.id, settings.job_retry_delay_seconds
+                )
+            else:
+                await self._give_up(db, job, str(e))
+            return
+        finally:
+            heartbeat.cancel()
+
+        if task.status == TaskStatus.COMPLETED:
+            await job_queue.complete(db, job_id, self.id, task.extraction_id)
+        else:
+            error = task.error or "Job ended without a result"
+            if task.finished_at is None:
+                await fail_task(job_id, error)
+            await job_queue.fail(db, job_id, self.id, error)
+
+    async def _heartbeat(
+        self,
+        db: AsyncIOMotorDatabase,
+        job_id: str,
+        work: asyncio.Task,
+        lease_lost: asyncio.Event,
+    ) -> None:
+        while True:
+            await asyncio.sleep(settings.job_heartbeat_seconds)
+            try:
+                renewed = await job_queue.heartbeat(db, job_id, self.id)
+            except Exception as e:
+                logger.warning(f"Heartbeat failed for job {job_id}: {e}")
+                continue
+            if not renewed:
+                lease_lost.set()
+                work.cancel()
+                return
+
+    async def _give_up(self, db: AsyncIOMotorDatabase, job: dict, error: str) -> None:
+        await fail_task(job["_id"], error)
+        await job_queue.fail(db, job["_id"], self.id, error)
+        payload = job["payload"]
+        if job["kind"] == "lead":
+            await campaign_service.update_lead_status(
+                db,
+                payload["campaign_id"],
+                payload["lead_id"],
+                status=LeadStatus.ERROR,
+                error=error,
+            )
+
+
+async def main() -> None:
+    client = AsyncIOMotorClient(settings.mongodb_uri)
+    set_client(client)
+    clients = Clients()
+    set_clients(clients)
+    await job_queue.ensure_indexes(get_database())
+
+    worker = Worker()
+    worker.start()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    await stop.wait()
+
+    await worker.stop()
+    await clients.close()
+    set_clients(None)
+    client.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    asyncio.run(main())
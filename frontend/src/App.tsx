@@ -1,6 +1,6 @@
 import { useEffect, useRef, useState } from 'react'
 import { extractProfile } from './api/identity'
-import { extractLead, parseLeads } from './api/leads'
+import { extractLeadsBatch, parseLeads } from './api/leads'
 import { CyberCampaignSidebar } from './components/CyberCampaignSidebar'
 import { CyberCreateCampaignModal } from './components/CyberCreateCampaignModal'
 import { CyberEmptyState } from './components/CyberEmptyState'
@@ -198,28 +198,26 @@ function AppContent() {
       }))
 
       const allLeads = [...existingLeads, ...newLeads]
-      updateLeads(allLeads)
+      // The batch endpoint reads leads from the saved campaign
+      await updateLeads(allLeads)
       addLog(`Parsed ${newLeads.length} lead queries`)
 
-      // Auto-start extraction for each new lead
-      const startIndex = existingLeads.length
-      for (let i = 0; i < newLeads.length; i++) {
-        const lead = newLeads[i]
-        const globalIndex = startIndex + i
-
-        try {
-          const extractResponse = await extractLead(
-            currentCampaign.id,
-            lead.id,
-            lead.query,
-            globalIndex
-          )
-          startLeadExtraction(lead.id, extractResponse.extraction_task_id)
-          addLog(`Started extraction for lead ${globalIndex + 1}`)
-        } catch (err) {
-          const msg = err instanceof Error ? err.message : 'Unknown error'
-          addLog(`ERROR: Failed to start extraction for lead ${globalIndex + 1}: ${msg}`)
+      // Auto-start extraction for all new leads in one request
+      try {
+        const batch = await extractLeadsBatch(
+          currentCampaign.id,
+          newLeads.map((lead) => lead.id)
+        )
+        for (const task of batch.tasks) {
+          startLeadExtraction(task.lead_id, task.extraction_task_id, currentCampaign.id)
         }
+        addLog(`Started extraction for ${batch.tasks.length} leads`)
+        if (batch.skipped.length > 0) {
+          addLog(`ERROR: Failed to start extraction for ${batch.skipped.length} leads`)
+        }
+      } catch (err) {
+        const msg = err instanceof Error ? err.message : 'Unknown error'
+        addLog(`ERROR: Failed to start extraction: ${msg}`)
       }
 
       return true
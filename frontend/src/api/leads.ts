@@ -8,6 +8,12 @@ export interface ExtractLeadResponse {
   extraction_task_id: string
 }
 
+export interface ExtractLeadsBatchResponse {
+  batch_id: string
+  tasks: { lead_id: string; extraction_task_id: string }[]
+  skipped: string[]
+}
+
 export async function parseLeads(rawText: string): Promise<ParseLeadsResponse> {
   const response = await fetch(`${API_URL}/api/leads/parse`, {
     method: 'POST',
@@ -51,3 +57,26 @@ export async function extractLead(
 
   return response.json()
 }
+
+export async function extractLeadsBatch(
+  campaignId: string,
+  leadIds: string[]
+): Promise<ExtractLeadsBatchResponse> {
+  const response = await fetch(`${API_URL}/api/leads/extract-batch`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+    },
+    body: JSON.stringify({
+      campaign_id: campaignId,
+      lead_ids: leadIds,
+    }),
+  })
+
+  if (!response.ok) {
+    const error = await response.json().catch(() => ({ detail: 'Unknown error' }))
+    throw new Error(error.detail || 'Failed to start extraction')
+  }
+
+  return response.json()
+}
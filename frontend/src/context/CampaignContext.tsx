@@ -29,7 +29,7 @@ interface CampaignContextValue {
   selectCampaign: (id: string) => Promise<void>
   createCampaign: (name: string) => Promise<void>
   updateProfile: (profile: FounderProfile) => void
-  updateLeads: (leads: Lead[]) => void
+  updateLeads: (leads: Lead[]) => Promise<void>
   refreshList: () => Promise<void>
   // Start/stop processing
   startProcessing: () => void
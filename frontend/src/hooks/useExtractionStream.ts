@@ -5,6 +5,7 @@ const API_URL = import.meta.env.VITE_API_URL || ''
 export type LogType = 'info' | 'progress' | 'success' | 'error'
 
 export interface LogEntry {
+  id?: number
   type: LogType
   message: string
   timestamp: string
@@ -81,6 +82,14 @@ export function useExtractionStream(taskId: string | null) {
     })
 
     eventSource.onerror = () => {
+      // The browser is reconnecting; it resends Last-Event-ID, so the
+      // server only replays the logs we missed
+      if (eventSource.readyState === EventSource.CONNECTING) {
+        setState((prev) =>
+          prev.status === 'completed' ? prev : { ...prev, status: 'connecting' }
+        )
+        return
+      }
       // Connection error - only set error if not already completed
       setState((prev) => {
         if (prev.status === 'completed') return prev
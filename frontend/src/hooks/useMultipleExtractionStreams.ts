@@ -5,6 +5,7 @@ const API_URL = import.meta.env.VITE_API_URL || ''
 export type LogType = 'info' | 'progress' | 'success' | 'error'
 
 export interface LogEntry {
+  id?: number
   type: LogType
   message: string
   timestamp: string
@@ -31,129 +32,196 @@ export interface LeadStreamState {
 interface UseMultipleExtractionStreamsReturn {
   combinedLogs: LogEntry[]
   leadStates: Map<string, LeadStreamState>
-  startExtraction: (leadId: string, taskId: string) => void
+  startExtraction: (leadId: string, taskId: string, campaignId: string) => void
   resetAll: () => void
   hasActiveStreams: boolean
 }
 
+// Every event on a campaign stream names the task and lead it belongs to
+interface CampaignEvent {
+  task_id: string
+  lead_id: string | null
+}
+
+interface TrackedTask {
+  leadId: string
+  campaignId: string
+}
+
 export function useMultipleExtractionStreams(): UseMultipleExtractionStreamsReturn {
   const [combinedLogs, setCombinedLogs] = useState<LogEntry[]>([])
   const [leadStates, setLeadStates] = useState<Map<string, LeadStreamState>>(
     new Map()
   )
 
+  // One stream per campaign, shared by all of its leads
   const eventSourcesRef = useRef<Map<string, EventSource>>(new Map())
+  // Task ID -> lead, for tasks still running
+  const tasksRef = useRef<Map<string, TrackedTask>>(new Map())
+  // Campaign ID -> last event ID seen, to resume if the stream is reopened
+  const lastEventIdsRef = useRef<Map<string, string>>(new Map())
 
-  const startExtraction = useCallback((leadId: string, taskId: string) => {
-    // Close existing connection for this lead if any
-    const existing = eventSourcesRef.current.get(leadId)
-    if (existing) {
-      existing.close()
-    }
-
-    // Update lead state to connecting
-    setLeadStates((prev) => {
-      const next = new Map(prev)
-      next.set(leadId, {
-        leadId,
-        status: 'connecting',
-        extractionTaskId: taskId,
-        verifiedClaimsId: null,
-        error: null,
-        progress: 0,
+  const updateLead = useCallback(
+    (leadId: string, update: (current: LeadStreamState) => LeadStreamState) => {
+      setLeadStates((prev) => {
+        const current = prev.get(leadId)
+        if (!current) return prev
+        const next = new Map(prev)
+        next.set(leadId, update(current))
+        return next
       })
-      return next
-    })
+    },
+    []
+  )
 
-    const eventSource = new EventSource(
-      `${API_URL}/api/extraction/${taskId}/stream`
+  const closeIfIdle = useCallback((campaignId: string) => {
+    const active = Array.from(tasksRef.current.values()).some(
+      (task) => task.campaignId === campaignId
     )
-    eventSourcesRef.current.set(leadId, eventSource)
+    if (active) return
+    eventSourcesRef.current.get(campaignId)?.close()
+    eventSourcesRef.current.delete(campaignId)
+  }, [])
 
-    eventSource.onopen = () => {
-      setLeadStates((prev) => {
-        const next = new Map(prev)
-        const current = next.get(leadId)
-        if (current) {
-          next.set(leadId, { ...current, status: 'streaming' })
+  const finishTask = useCallback(
+    (taskId: string) => {
+      const task = tasksRef.current.get(taskId)
+      if (!task) return
+      tasksRef.current.delete(taskId)
+      closeIfIdle(task.campaignId)
+    },
+    [closeIfIdle]
+  )
+
+  const openCampaignStream = useCallback(
+    (campaignId: string) => {
+      if (eventSourcesRef.current.has(campaignId)) return
+
+      const since = lastEventIdsRef.current.get(campaignId)
+      const query = since ? `?since=${encodeURIComponent(since)}` : ''
+      const eventSource = new EventSource(
+        `${API_URL}/api/campaigns/${campaignId}/events${query}`
+      )
+      eventSourcesRef.current.set(campaignId, eventSource)
+
+      // Resolve an event to a lead we started; other tasks are ignored
+      const track = (event: MessageEvent) => {
+        if (event.lastEventId) {
+          lastEventIdsRef.current.set(campaignId, event.lastEventId)
         }
-        return next
-      })
-    }
+        const data = JSON.parse(event.data) as CampaignEvent
+        const task = tasksRef.current.get(data.task_id)
+        return task ? { data, leadId: task.leadId } : null
+      }
 
-    eventSource.addEventListener('log', (event) => {
-      const data = JSON.parse(event.data) as LogEntry
-      const enrichedLog = { ...data, leadId }
-      setCombinedLogs((prev) => [...prev, enrichedLog])
-
-      if (data.progress !== undefined) {
-        setLeadStates((prev) => {
-          const next = new Map(prev)
-          const current = next.get(leadId)
-          if (current) {
-            next.set(leadId, { ...current, progress: data.progress! })
-          }
-          return next
+      eventSource.onopen = () => {
+        tasksRef.current.forEach((task) => {
+          if (task.campaignId !== campaignId) return
+          updateLead(task.leadId, (current) =>
+            current.status === 'connecting'
+              ? { ...current, status: 'streaming' }
+              : current
+          )
         })
       }
-    })
 
-    eventSource.addEventListener('complete', (event) => {
-      const data = JSON.parse(event.data) as { extraction_id: string }
-      setLeadStates((prev) => {
-        const next = new Map(prev)
-        const current = next.get(leadId)
-        if (current) {
-          next.set(leadId, {
-            ...current,
-            status: 'completed',
-            verifiedClaimsId: data.extraction_id,
-            progress: 100,
-          })
+      eventSource.addEventListener('log', (event) => {
+        const tracked = track(event)
+        if (!tracked) return
+        const data = tracked.data as CampaignEvent & LogEntry
+        const log: LogEntry = {
+          id: data.id,
+          type: data.type,
+          message: data.message,
+          timestamp: data.timestamp,
+          progress: data.progress,
+          leadId: tracked.leadId,
         }
-        return next
+        setCombinedLogs((prev) => [...prev, log])
+
+        updateLead(tracked.leadId, (current) => ({
+          ...current,
+          status: 'streaming',
+          progress: data.progress ?? current.progress,
+        }))
       })
-      eventSource.close()
-      eventSourcesRef.current.delete(leadId)
-    })
-
-    eventSource.addEventListener('error', (event) => {
-      if (event instanceof MessageEvent) {
-        const data = JSON.parse(event.data) as { message: string }
-        setLeadStates((prev) => {
-          const next = new Map(prev)
-          const current = next.get(leadId)
-          if (current) {
-            next.set(leadId, { ...current, status: 'error', error: data.message })
-          }
-          return next
-        })
-      }
-      eventSource.close()
-      eventSourcesRef.current.delete(leadId)
-    })
 
-    eventSource.onerror = () => {
-      setLeadStates((prev) => {
-        const next = new Map(prev)
-        const current = next.get(leadId)
-        if (current && current.status !== 'completed') {
-          next.set(leadId, {
+      eventSource.addEventListener('complete', (event) => {
+        const tracked = track(event)
+        if (!tracked) return
+        const data = tracked.data as CampaignEvent & { extraction_id: string }
+        updateLead(tracked.leadId, (current) => ({
+          ...current,
+          status: 'completed',
+          verifiedClaimsId: data.extraction_id,
+          progress: 100,
+        }))
+        finishTask(data.task_id)
+      })
+
+      eventSource.addEventListener('error', (event) => {
+        if (event instanceof MessageEvent) {
+          const tracked = track(event)
+          if (!tracked) return
+          const data = tracked.data as CampaignEvent & { message: string }
+          updateLead(tracked.leadId, (current) => ({
             ...current,
             status: 'error',
-            error: 'Connection lost',
-          })
+            error: data.message,
+          }))
+          finishTask(data.task_id)
+          return
         }
+
+        // Let the browser reconnect; it resumes from Last-Event-ID
+        if (eventSource.readyState === EventSource.CONNECTING) return
+        eventSourcesRef.current.delete(campaignId)
+        tasksRef.current.forEach((task, taskId) => {
+          if (task.campaignId !== campaignId) return
+          updateLead(task.leadId, (current) =>
+            current.status === 'completed'
+              ? current
+              : { ...current, status: 'error', error: 'Connection lost' }
+          )
+          tasksRef.current.delete(taskId)
+        })
+      })
+    },
+    [finishTask, updateLead]
+  )
+
+  const startExtraction = useCallback(
+    (leadId: string, taskId: string, campaignId: string) => {
+      // Stop following any earlier task for this lead
+      tasksRef.current.forEach((task, id) => {
+        if (task.leadId === leadId) tasksRef.current.delete(id)
+      })
+      tasksRef.current.set(taskId, { leadId, campaignId })
+
+      const eventSource = eventSourcesRef.current.get(campaignId)
+      const streaming = eventSource?.readyState === EventSource.OPEN
+      setLeadStates((prev) => {
+        const next = new Map(prev)
+        next.set(leadId, {
+          leadId,
+          status: streaming ? 'streaming' : 'connecting',
+          extractionTaskId: taskId,
+          verifiedClaimsId: null,
+          error: null,
+          progress: 0,
+        })
         return next
       })
-      eventSource.close()
-      eventSourcesRef.current.delete(leadId)
-    }
-  }, [])
+
+      openCampaignStream(campaignId)
+    },
+    [openCampaignStream]
+  )
 
   const resetAll = useCallback(() => {
     eventSourcesRef.current.forEach((es) => es.close())
     eventSourcesRef.current.clear()
+    tasksRef.current.clear()
     setCombinedLogs([])
     setLeadStates(new Map())
   }, [])